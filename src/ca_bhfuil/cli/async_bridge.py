@@ -7,16 +7,30 @@ import typing
 from rich import console
 from rich import progress
 
+from ca_bhfuil.core import async_sync
+from ca_bhfuil.core.managers import factory
+
 
 rich_console = console.Console()
 
 
+async def _run_and_release_globals(
+    main_coro: typing.Coroutine[typing.Any, typing.Any, typing.Any],
+) -> typing.Any:
+    """Await the entry point, then release process-wide async resources."""
+    try:
+        return await main_coro
+    finally:
+        async_sync.shutdown_global_synchronizer()
+        await factory.close_global_factory()
+
+
 def run_async(
     main_coro: typing.Coroutine[typing.Any, typing.Any, typing.Any],
 ) -> typing.Any:
     """Run the main async entry point."""
     try:
-        return asyncio.run(main_coro)
+        return asyncio.run(_run_and_release_globals(main_coro))
     except KeyboardInterrupt:
         rich_console.print("\n[yellow]Operation cancelled by user.[/yellow]")
         return None
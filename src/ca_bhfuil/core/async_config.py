@@ -1,6 +1,7 @@
 """Asynchronous configuration management."""
 
 import asyncio
+import json
 import pathlib
 import typing
 
@@ -23,25 +24,58 @@ class AsyncConfigManager:
         self._config_cache: dict[str, typing.Any] = {}
         self._cache_lock = asyncio.Lock()
 
+        # Repository name index, rebuilt whenever repos.yaml changes
+        self._by_name: dict[str, config.RepositoryConfig] = {}
+        self._index_signature: tuple[int, int] | None = config.UNINDEXED
+
         # Ensure directories exist
         config.setup_secure_directories()
 
+    async def _read_config(self, path: pathlib.Path) -> typing.Any:
+        """Read a configuration file without blocking the event loop.
+
+        The file is read with aiofiles and parsed in a worker thread so that
+        large YAML documents do not stall other coroutines.
+        """
+        async with aiofiles.open(path, encoding="utf-8") as f:
+            content = await f.read()
+        return await asyncio.to_thread(config.parse_config_text, content)
+
+    async def _repositories_signature(self) -> tuple[int, int] | None:
+        """Get the signature of repos.yaml, statting it in a worker thread."""
+        return await asyncio.to_thread(config.file_signature, self.repositories_file)
+
     async def load_configuration(self) -> config.GlobalConfig:
         """Load and validate all configuration files asynchronously."""
-        if not self.repositories_file.exists():
-            return config.GlobalConfig()
+        signature = await self._repositories_signature()
+        if signature is None:
+            global_config = config.GlobalConfig()
+            self._index_repositories(global_config, signature)
+            return global_config
 
         try:
-            async with aiofiles.open(self.repositories_file, encoding="utf-8") as f:
-                content = await f.read()
-                config_data = yaml.safe_load(content) or {}
+            config_data = await self._read_config(self.repositories_file) or {}
 
-            return config.GlobalConfig(**config_data)
+            global_config = config.GlobalConfig(**config_data)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {self.repositories_file}: {e}") from e
         except Exception as e:
             raise ValueError(f"Error loading configuration: {e}") from e
 
+        self._index_repositories(global_config, signature)
+        return global_config
+
+    def _index_repositories(
+        self, global_config: config.GlobalConfig, signature: tuple[int, int] | None
+    ) -> None:
+        """Build the repository name index from a loaded configuration.
+
+        Iterates in reverse so the first repository wins on duplicate names,
+        matching a linear scan.
+        """
+        self._by_name = {repo.name: repo for repo in reversed(global_config.repos)}
+        self._index_signature = signature
+
     async def get_repository_config(
         self, url_path: str
     ) -> config.RepositoryConfig | None:
@@ -65,12 +99,14 @@ class AsyncConfigManager:
     async def get_repository_config_by_name(
         self, name: str
     ) -> config.RepositoryConfig | None:
-        """Get configuration for specific repository by name."""
-        global_config = await self.load_configuration()
-        for repo in global_config.repos:
-            if repo.name == name:
-                return repo
-        return None
+        """Get configuration for specific repository by name.
+
+        Served from the name index, which is only rebuilt when repos.yaml
+        has changed since it was last loaded.
+        """
+        if await self._repositories_signature() != self._index_signature:
+            await self.load_configuration()
+        return self._by_name.get(name)
 
     async def validate_configuration(self) -> list[str]:
         """Validate configuration and return list of errors."""
@@ -79,23 +115,10 @@ class AsyncConfigManager:
         try:
             global_config = await self.load_configuration()
 
-            # Check for duplicate repository names
-            names = [repo.name for repo in global_config.repos]
-            if len(names) != len(set(names)):
-                errors.append("Duplicate repository names found")
-
-            # Check for duplicate URLs
-            urls = [repo.source.get("url") for repo in global_config.repos]
-            if len(urls) != len(set(urls)):
-                errors.append("Duplicate repository URLs found")
-
-            # Validate auth references
             auth_config = await self.load_auth_config()
-            for repo in global_config.repos:
-                if repo.auth_key and repo.auth_key not in auth_config:
-                    errors.append(
-                        f"Repository '{repo.name}' references unknown auth key '{repo.auth_key}'"
-                    )
+            errors.extend(
+                config.validate_repositories(global_config.repos, auth_config)
+            )
 
         except Exception as e:
             errors.append(f"Configuration loading error: {e}")
@@ -121,7 +144,12 @@ class AsyncConfigManager:
                 self.repositories_file, "w", encoding="utf-8"
             ) as f:
                 await f.write(
-                    yaml.dump(default_config, default_flow_style=False, indent=2)
+                    yaml.dump(
+                        default_config,
+                        Dumper=config.YAML_DUMPER,
+                        default_flow_style=False,
+                        indent=2,
+                    )
                 )
 
         # Create default global-settings.yaml
@@ -148,7 +176,12 @@ class AsyncConfigManager:
                 self.global_settings_file, "w", encoding="utf-8"
             ) as f:
                 await f.write(
-                    yaml.dump(default_global, default_flow_style=False, indent=2)
+                    yaml.dump(
+                        default_global,
+                        Dumper=config.YAML_DUMPER,
+                        default_flow_style=False,
+                        indent=2,
+                    )
                 )
 
         # Create auth.yaml template (with restrictive permissions)
@@ -166,12 +199,12 @@ class AsyncConfigManager:
             },
         }
 
+        # Written as JSON, which YAML loaders still accept, for faster loads
         if not self.auth_file.exists():
-            async with aiofiles.open(self.auth_file, "w", encoding="utf-8") as f:
-                await f.write(
-                    yaml.dump(auth_template, default_flow_style=False, indent=2)
-                )
-            self.auth_file.chmod(0o600)  # Secure permissions
+            async with aiofiles.open(
+                self.auth_file, "w", encoding="utf-8", opener=config.private_opener
+            ) as f:
+                await f.write(json.dumps(auth_template, indent=2))
 
     async def load_auth_config(self) -> dict[str, config.AuthMethod]:
         """Load authentication configuration from auth.yaml asynchronously."""
@@ -179,9 +212,7 @@ class AsyncConfigManager:
             return {}
 
         try:
-            async with aiofiles.open(self.auth_file, encoding="utf-8") as f:
-                content = await f.read()
-                auth_data = yaml.safe_load(content) or {}
+            auth_data = await self._read_config(self.auth_file) or {}
 
             auth_methods = {}
             for key, method_data in auth_data.get("auth_methods", {}).items():
@@ -225,7 +256,14 @@ class AsyncConfigManager:
         }
 
         async with aiofiles.open(self.repositories_file, "w", encoding="utf-8") as f:
-            await f.write(yaml.dump(config_data, default_flow_style=False, indent=2))
+            await f.write(
+                yaml.dump(
+                    config_data,
+                    Dumper=config.YAML_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                )
+            )
 
 
 # Global async configuration manager instance
@@ -10,6 +10,7 @@ from ca_bhfuil.core import async_config
 from ca_bhfuil.core import config
 from ca_bhfuil.core.models import commit as commit_models
 from ca_bhfuil.storage import sqlmodel_manager
+from ca_bhfuil.storage.database import models as db_models
 
 
 class AsyncRepositoryRegistry:
@@ -183,6 +184,78 @@ class AsyncRepositoryRegistry:
         )
         return False
 
+    async def registered_repository_names(
+        self, repo_names: typing.Iterable[str]
+    ) -> set[str]:
+        """Find which repositories are already registered, in one query.
+
+        Args:
+            repo_names: Repository names
+
+        Returns:
+            Names of the configured repositories present in the database
+        """
+        paths = await self._repository_paths(repo_names)
+        repo_ids = await self.db_manager.get_repository_ids(paths.values())
+        return {name for name, path in paths.items() if path in repo_ids}
+
+    async def update_repository_stats_bulk(
+        self, stats: typing.Sequence[tuple[str, int, int]]
+    ) -> dict[str, bool]:
+        """Update statistics for several repositories in one transaction.
+
+        Registered repositories are updated with a single batched UPDATE.
+        Any that are not registered yet go through update_repository_stats()
+        so they are auto-registered as usual.
+
+        Args:
+            stats: (repository name, commit count, branch count) for each
+                repository
+
+        Returns:
+            Whether each repository was updated, keyed by name
+        """
+        paths = await self._repository_paths(name for name, _, _ in stats)
+        repo_ids = await self.db_manager.get_repository_ids(paths.values())
+
+        updated: dict[str, bool] = {}
+        batch: list[tuple[int, int, int]] = []
+        for repo_name, commit_count, branch_count in stats:
+            path = paths.get(repo_name)
+            repo_id = repo_ids.get(path) if path else None
+            if repo_id is None:
+                updated[repo_name] = await self.update_repository_stats(
+                    repo_name, commit_count, branch_count
+                )
+            else:
+                batch.append((repo_id, commit_count, branch_count))
+                updated[repo_name] = True
+
+        if batch:
+            await self.db_manager.update_repository_stats_bulk(batch)
+            logger.debug(f"Updated stats for {len(batch)} repositories in one batch")
+        return updated
+
+    async def _repository_paths(
+        self, repo_names: typing.Iterable[str]
+    ) -> dict[str, str]:
+        """Map configured repository names to their repository paths.
+
+        Args:
+            repo_names: Repository names
+
+        Returns:
+            Repository paths keyed by name, for the names that are configured
+        """
+        paths = {}
+        for repo_name in repo_names:
+            repo_config = await self.config_manager.get_repository_config_by_name(
+                repo_name
+            )
+            if repo_config:
+                paths[repo_name] = str(repo_config.repo_path)
+        return paths
+
     async def add_commit(
         self, repo_name: str, commit_info: commit_models.CommitInfo
     ) -> bool:
@@ -253,24 +326,48 @@ class AsyncRepositoryRegistry:
         Returns:
             List of matching commits
         """
+        repo_id = await self._registered_repository_id(repo_name)
+        if repo_id is None:
+            return []
+
+        commit_data_list = await self.db_manager.find_commits(
+            repo_id, sha_pattern, message_pattern, limit
+        )
+        return self._to_commit_infos(commit_data_list)
+
+    async def _registered_repository_id(self, repo_name: str) -> int | None:
+        """Look up the database ID of a configured, registered repository.
+
+        Args:
+            repo_name: Repository name
+
+        Returns:
+            Repository ID, or None if not configured or not registered
+        """
         repo_config = await self.config_manager.get_repository_config_by_name(repo_name)
         if not repo_config:
             logger.warning(f"Repository configuration not found: {repo_name}")
-            return []
-
-        repo_path_str = str(repo_config.repo_path)
-        db_repo = await self.db_manager.get_repository(repo_path_str)
+            return None
 
+        db_repo = await self.db_manager.get_repository(str(repo_config.repo_path))
         if not db_repo:
             logger.debug(f"Repository {repo_name} not found in database")
-            return []
+            return None
 
-        repo_id = db_repo.id or 0
-        commit_data_list = await self.db_manager.find_commits(
-            repo_id, sha_pattern, message_pattern, limit
-        )
+        return db_repo.id or 0
 
-        # Convert database results to CommitInfo models
+    @staticmethod
+    def _to_commit_infos(
+        commit_data_list: typing.Iterable[db_models.CommitRead],
+    ) -> list[commit_models.CommitInfo]:
+        """Convert database results to CommitInfo models.
+
+        Args:
+            commit_data_list: Commit read models from the database
+
+        Returns:
+            Commits that could be converted
+        """
         commits = []
         for commit_data in commit_data_list:
             try:
@@ -1,6 +1,10 @@
 """Async repository synchronization for keeping repositories up to date."""
 
 import asyncio
+import collections.abc
+import contextlib
+import pathlib
+import threading
 import time
 import typing
 
@@ -11,11 +15,28 @@ from ca_bhfuil.core import async_config
 from ca_bhfuil.core import async_registry
 from ca_bhfuil.core import config
 from ca_bhfuil.core.git import async_git
-from ca_bhfuil.core.git import repository as repository_module
 from ca_bhfuil.core.managers import factory as manager_factory
 from ca_bhfuil.core.models import results as results_models
 
 
+# Most repository handles a synchronizer keeps open at once
+_MAX_REPO_HANDLES = 16
+
+
+class _RepositoryHandle(typing.NamedTuple):
+    """An open repository and what it was opened against."""
+
+    git_dir: pathlib.Path
+    head_signature: tuple[int, int] | None
+    repo: pygit2.Repository
+    # libgit2 repository objects must not be used by two threads at once
+    lock: threading.Lock
+
+
+# A synced repository whose registry stats and database sync were deferred
+_DeferredSync = tuple[config.RepositoryConfig, tuple[str, int, int] | None]
+
+
 class AsyncRepositorySynchronizer:
     """Handles asynchronous synchronization of git repositories."""
 
@@ -24,6 +45,7 @@ class AsyncRepositorySynchronizer:
         config_manager: async_config.AsyncConfigManager | None = None,
         repo_registry: async_registry.AsyncRepositoryRegistry | None = None,
         git_manager: async_git.AsyncGitManager | None = None,
+        max_concurrent_syncs: int = 3,
     ) -> None:
         """Initialize async repository synchronizer.
 
@@ -31,11 +53,18 @@ class AsyncRepositorySynchronizer:
             config_manager: Async configuration manager instance
             repo_registry: Async repository registry instance
             git_manager: Async git manager instance
+            max_concurrent_syncs: Maximum repositories synchronized at once
         """
         self.config_manager = config_manager or async_config.AsyncConfigManager()
         self.repo_registry = repo_registry or async_registry.AsyncRepositoryRegistry()
         self.git_manager = git_manager or async_git.AsyncGitManager()
-        self._sync_semaphore = asyncio.Semaphore(3)  # Limit concurrent syncs
+        self._sync_semaphore = asyncio.Semaphore(max_concurrent_syncs)
+        # Open repositories by path in least recently used order; used from
+        # executor threads, hence the lock
+        self._repo_handles: collections.OrderedDict[pathlib.Path, _RepositoryHandle] = (
+            collections.OrderedDict()
+        )
+        self._repo_handles_lock = threading.Lock()
         logger.debug("Initialized async repository synchronizer")
 
     async def sync_repository(self, repo_name: str) -> results_models.OperationResult:
@@ -44,6 +73,25 @@ class AsyncRepositorySynchronizer:
         Args:
             repo_name: Repository name
 
+        Returns:
+            Operation result with sync information
+        """
+        return await self._sync_repository(repo_name, None)
+
+    async def _sync_repository(
+        self,
+        repo_name: str,
+        deferred: list[_DeferredSync] | None,
+    ) -> results_models.OperationResult:
+        """Synchronize a single repository asynchronously.
+
+        Args:
+            repo_name: Repository name
+            deferred: If given, the repository's configuration and registry
+                statistics are appended here instead of being written
+                straight away, so the caller can bulk update the stats and
+                then sync the commits to the database
+
         Returns:
             Operation result with sync information
         """
@@ -88,20 +136,12 @@ class AsyncRepositorySynchronizer:
 
                 # Update registry with latest state and sync commits to database
                 if sync_result["success"]:
-                    await self._update_registry_after_sync(repo_config, sync_result)
-
-                    # Get repository manager and sync to database
-                    try:
-                        repo_manager = await manager_factory.get_repository_manager(
-                            repo_config.repo_path
-                        )
-                        await repo_manager.sync_with_database()
-                        logger.info(f"Synced {repo_config.name} commits to database")
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to sync {repo_config.name} commits to database: {e}"
-                        )
-                        # Don't fail the overall sync operation if database sync fails
+                    if deferred is None:
+                        await self._update_registry_after_sync(repo_config, sync_result)
+                        await self._sync_to_database(repo_config)
+                    else:
+                        stats = await self._registry_stats(repo_config, sync_result)
+                        deferred.append((repo_config, stats))
 
                 return results_models.OperationResult(
                     success=sync_result["success"],
@@ -115,6 +155,27 @@ class AsyncRepositorySynchronizer:
                     success=False, duration=time.time() - start_time, error=str(e)
                 )
 
+    async def _sync_to_database(self, repo_config: config.RepositoryConfig) -> None:
+        """Sync a repository's commits to the database.
+
+        This also writes the repository's stored commit and branch counts,
+        so it must run after the registry stats update for the same sync.
+
+        Args:
+            repo_config: Repository configuration
+        """
+        try:
+            repo_manager = await manager_factory.get_repository_manager(
+                repo_config.repo_path
+            )
+            await repo_manager.sync_with_database()
+            logger.info(f"Synced {repo_config.name} commits to database")
+        except Exception as e:
+            logger.warning(
+                f"Failed to sync {repo_config.name} commits to database: {e}"
+            )
+            # Don't fail the overall sync operation if database sync fails
+
     def _perform_sync_sync(
         self, repo_config: config.RepositoryConfig
     ) -> dict[str, typing.Any]:
@@ -146,13 +207,17 @@ class AsyncRepositorySynchronizer:
             }
 
         try:
-            # Open repository and get basic stats
-            repo = pygit2.Repository(str(repo_path))
-            commit_count = len(list(repo.walk(repo.head.target)))
+            # Open repository once and collect the stats the registry needs
+            with self._repository(repo_path) as repo:
+                # Count commits as the walk yields them rather than
+                # materializing the history into a list
+                commit_count = sum(1 for _ in repo.walk(repo.head.target))
+                branch_count = sum(1 for _ in repo.branches)
             return {
                 "success": True,
                 "commits_before": commit_count,
                 "commits_after": commit_count,
+                "branch_count": branch_count,
                 "repository": repo_config.name,
             }
         except Exception as e:
@@ -163,40 +228,167 @@ class AsyncRepositorySynchronizer:
                 "commits_after": 0,
             }
 
-    async def _update_registry_after_sync(
+    @staticmethod
+    def _head_signature(git_dir: pathlib.Path) -> tuple[int, int] | None:
+        """Get the (inode, mtime_ns) of a git directory's HEAD file.
+
+        Args:
+            git_dir: Git directory as resolved by pygit2
+
+        Returns:
+            HEAD file signature, or None if it cannot be read
+        """
+        try:
+            head_stat = (git_dir / "HEAD").stat()
+        except OSError:
+            return None
+        return head_stat.st_ino, head_stat.st_mtime_ns
+
+    @contextlib.contextmanager
+    def _repository(
+        self, repo_path: pathlib.Path
+    ) -> collections.abc.Iterator[pygit2.Repository]:
+        """Use a repository, reusing the handle from an earlier call (for executor).
+
+        The cached handle is reused while the HEAD file in the git directory
+        pygit2 resolved keeps the same inode and modification time, so a
+        repository that is re-cloned or switches branch is opened afresh.
+        Resolving through pygit2 covers checkouts whose .git is a file, such
+        as worktrees and submodules. Only the most recently used handles
+        are kept, and each is used by one thread at a time.
+
+        Args:
+            repo_path: Path to the repository
+
+        Yields:
+            Open pygit2 repository
+
+        Raises:
+            pygit2.GitError: If the path is not a valid git repository
+        """
+        handle = self._cached_handle(repo_path)
+        if handle is None:
+            # Open outside the cache lock so other repositories are not held up
+            handle = self._cache_handle(repo_path, pygit2.Repository(str(repo_path)))
+
+        with handle.lock:
+            yield handle.repo
+
+    def _cached_handle(self, repo_path: pathlib.Path) -> _RepositoryHandle | None:
+        """Get the cached handle for a repository if it is still current.
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            Cached handle, or None if there is no current one
+        """
+        with self._repo_handles_lock:
+            handle = self._repo_handles.get(repo_path)
+            if handle is None:
+                return None
+            if self._head_signature(handle.git_dir) != handle.head_signature:
+                del self._repo_handles[repo_path]
+                return None
+            self._repo_handles.move_to_end(repo_path)
+            return handle
+
+    def _cache_handle(
+        self, repo_path: pathlib.Path, repo: pygit2.Repository
+    ) -> _RepositoryHandle:
+        """Cache a newly opened repository, unless another thread beat us to it.
+
+        Args:
+            repo_path: Path to the repository
+            repo: Newly opened repository
+
+        Returns:
+            Handle to use for the repository
+        """
+        git_dir = pathlib.Path(repo.path)
+        handle = _RepositoryHandle(
+            git_dir, self._head_signature(git_dir), repo, threading.Lock()
+        )
+        if handle.head_signature is None:
+            # Nothing to validate a cached handle against
+            return handle
+
+        with self._repo_handles_lock:
+            current = self._repo_handles.get(repo_path)
+            if current is not None and current.head_signature == handle.head_signature:
+                self._repo_handles.move_to_end(repo_path)
+                return current
+
+            self._repo_handles[repo_path] = handle
+            self._repo_handles.move_to_end(repo_path)
+            if len(self._repo_handles) > _MAX_REPO_HANDLES:
+                self._repo_handles.popitem(last=False)
+            return handle
+
+    def _count_branches(self, repo_path: pathlib.Path) -> int:
+        """Count the branches of a repository (for executor).
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            Number of local and remote branches
+        """
+        with self._repository(repo_path) as repo:
+            return sum(1 for _ in repo.branches)
+
+    async def _registry_stats(
         self,
         repo_config: config.RepositoryConfig,
         sync_result: dict[str, typing.Any],
-    ) -> None:
-        """Update repository registry after successful sync.
+    ) -> tuple[str, int, int] | None:
+        """Collect the registry statistics for a successfully synced repository.
 
         Args:
             repo_config: Repository configuration
             sync_result: Sync operation result
+
+        Returns:
+            (repository name, commit count, branch count), or None if the
+            statistics could not be collected
         """
         try:
-            # Get updated repository statistics
-            repo_wrapper = await self.git_manager.run_in_executor(
-                repository_module.Repository, repo_config.repo_path
-            )
-            branches = await self.git_manager.run_in_executor(
-                repo_wrapper.list_branches
-            )
-            branch_count = len(branches)
+            # Reuse the branch count taken during sync, opening the repository
+            # again only when the sync result does not carry one
+            branch_count = sync_result.get("branch_count")
+            if branch_count is None:
+                branch_count = await self.git_manager.run_in_executor(
+                    self._count_branches, repo_config.repo_path
+                )
+        except Exception as e:
+            logger.warning(f"Failed to collect registry stats after sync: {e}")
+            return None
 
-            # For commit count, use the sync result
-            commit_count = sync_result.get("commits_after", 0)
+        # For commit count, use the sync result
+        commit_count = sync_result.get("commits_after", 0)
+        return repo_config.name, commit_count, branch_count
 
-            # Update registry stats
-            await self.repo_registry.update_repository_stats(
-                repo_config.name, commit_count, branch_count
-            )
+    async def _update_registry_after_sync(
+        self,
+        repo_config: config.RepositoryConfig,
+        sync_result: dict[str, typing.Any],
+    ) -> None:
+        """Update repository registry after successful sync.
+
+        Args:
+            repo_config: Repository configuration
+            sync_result: Sync operation result
+        """
+        stats = await self._registry_stats(repo_config, sync_result)
+        if stats is None:
+            return
 
+        try:
+            await self.repo_registry.update_repository_stats(*stats)
             logger.debug(
                 f"Updated registry stats for {repo_config.name}: "
-                f"{commit_count} commits, {branch_count} branches"
+                f"{stats[1]} commits, {stats[2]} branches"
             )
-
         except Exception as e:
             logger.warning(f"Failed to update registry after sync: {e}")
 
@@ -216,12 +408,40 @@ class AsyncRepositorySynchronizer:
         )
         start_time = time.time()
 
+        # Registered repositories defer their stats for one bulk update;
+        # the rest are written as they finish so they get auto-registered
+        registered = await self._registered_repository_names(repo_names)
+        deferred: list[_DeferredSync] = []
+
         # Create sync tasks
-        tasks = [self.sync_repository(repo_name) for repo_name in repo_names]
+        tasks = [
+            self._sync_repository(
+                repo_name, deferred if repo_name in registered else None
+            )
+            for repo_name in repo_names
+        ]
 
         # Run concurrently
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        stats_batch = [stats for _, stats in deferred if stats is not None]
+        if stats_batch:
+            try:
+                await self.repo_registry.update_repository_stats_bulk(stats_batch)
+            except Exception as e:
+                logger.warning(f"Failed to update registry after sync: {e}")
+
+        # Sync commits only after the bulk stats update, in the same order as
+        # a single sync, so every repository ends up with the counts written
+        # by the database sync
+        async def sync_to_database(repo_config: config.RepositoryConfig) -> None:
+            async with self._sync_semaphore:
+                await self._sync_to_database(repo_config)
+
+        await asyncio.gather(
+            *(sync_to_database(repo_config) for repo_config, _ in deferred)
+        )
+
         # Process results and handle exceptions
         processed_results: list[results_models.OperationResult] = []
         for i, result in enumerate(results):
@@ -254,6 +474,21 @@ class AsyncRepositorySynchronizer:
 
         return processed_results
 
+    async def _registered_repository_names(self, repo_names: list[str]) -> set[str]:
+        """Find which repositories are registered, treating errors as none.
+
+        Args:
+            repo_names: Repository names
+
+        Returns:
+            Names of the repositories already in the registry
+        """
+        try:
+            return await self.repo_registry.registered_repository_names(repo_names)
+        except Exception as e:
+            logger.warning(f"Failed to look up registered repositories: {e}")
+            return set()
+
     async def sync_all_repositories(self) -> list[results_models.OperationResult]:
         """Synchronize all configured repositories concurrently.
 
@@ -420,6 +655,8 @@ class AsyncRepositorySynchronizer:
 
     def shutdown(self) -> None:
         """Shutdown the synchronizer and clean up resources."""
+        with self._repo_handles_lock:
+            self._repo_handles.clear()
         self.git_manager.shutdown()
 
 
@@ -433,3 +670,12 @@ async def get_async_repository_synchronizer() -> AsyncRepositorySynchronizer:
     if _async_synchronizer is None:
         _async_synchronizer = AsyncRepositorySynchronizer()
     return _async_synchronizer
+
+
+def shutdown_global_synchronizer() -> None:
+    """Shut down the global async synchronizer so the next get creates a new one."""
+    global _async_synchronizer
+
+    if _async_synchronizer:
+        _async_synchronizer.shutdown()
+        _async_synchronizer = None
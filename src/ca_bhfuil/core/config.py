@@ -1,10 +1,16 @@
 """Configuration management for ca-bhfuil with XDG Base Directory compliance."""
 
+import collections
+import copy
+import fnmatch
+import functools
+import json
 import os
 import pathlib
 import re
 import typing  # Any
 
+from loguru import logger
 import pydantic  # BaseModel, Field, field_validator
 import yaml
 
@@ -12,28 +18,53 @@ from ..utils import paths
 
 
 # XDG Base Directory utilities
+@functools.cache
+def _app_dir(xdg_home: str | None, home: str | None, *default: str) -> pathlib.Path:
+    """Resolve an application directory under an XDG base directory.
+
+    Cached on the relevant environment values, so changing XDG_* or HOME
+    (e.g. under mock.patch.dict) resolves afresh.
+
+    Args:
+        xdg_home: Value of the XDG_*_HOME variable, if set
+        home: Value of HOME, if set
+        default: Path components under the home directory to fall back to
+
+    Returns:
+        The ca-bhfuil directory under the base directory
+    """
+    if xdg_home:
+        return pathlib.Path(xdg_home) / "ca-bhfuil"
+    home_dir = pathlib.Path(home) if home else pathlib.Path.home()
+    return home_dir.joinpath(*default, "ca-bhfuil")
+
+
 def get_config_dir() -> pathlib.Path:
     """Get XDG_CONFIG_HOME compliant config directory."""
-    xdg_config = os.environ.get("XDG_CONFIG_HOME")
-    if xdg_config:
-        return pathlib.Path(xdg_config) / "ca-bhfuil"
-    return pathlib.Path.home() / ".config" / "ca-bhfuil"
+    return _app_dir(
+        os.environ.get("XDG_CONFIG_HOME"), os.environ.get("HOME"), ".config"
+    )
 
 
 def get_state_dir() -> pathlib.Path:
     """Get XDG_STATE_HOME compliant state directory."""
-    xdg_state = os.environ.get("XDG_STATE_HOME")
-    if xdg_state:
-        return pathlib.Path(xdg_state) / "ca-bhfuil"
-    return pathlib.Path.home() / ".local" / "state" / "ca-bhfuil"
+    return _app_dir(
+        os.environ.get("XDG_STATE_HOME"), os.environ.get("HOME"), ".local", "state"
+    )
 
 
 def get_cache_dir() -> pathlib.Path:
     """Get XDG_CACHE_HOME compliant cache directory."""
-    xdg_cache = os.environ.get("XDG_CACHE_HOME")
-    if xdg_cache:
-        return pathlib.Path(xdg_cache) / "ca-bhfuil"
-    return pathlib.Path.home() / ".cache" / "ca-bhfuil"
+    return _app_dir(os.environ.get("XDG_CACHE_HOME"), os.environ.get("HOME"), ".cache")
+
+
+def private_opener(path: str, flags: int) -> int:
+    """Open a file for open(), creating it readable by the owner only.
+
+    Passing the mode to os.open avoids a separate chmod and the window in
+    which a new file is readable by others.
+    """
+    return os.open(path, flags, 0o600)
 
 
 def setup_secure_directories() -> None:
@@ -53,10 +84,149 @@ def setup_secure_directories() -> None:
         auth_file.chmod(0o600)
 
 
+# Use the LibYAML C implementation when PyYAML was built with it
+YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def load_yaml(stream: str | typing.IO[str]) -> typing.Any:
+    """Parse YAML with the safe loader, using LibYAML when available.
+
+    Args:
+        stream: YAML document text or an open text file
+
+    Returns:
+        The parsed YAML data
+    """
+    return yaml.load(stream, Loader=YAML_LOADER)  # noqa: S506  # safe loader
+
+
+def parse_config_text(text: str) -> typing.Any:
+    """Parse configuration file text written as either JSON or YAML.
+
+    JSON is valid YAML, but json.loads is far faster than any YAML loader,
+    so documents that look like a JSON object are tried as JSON first.
+
+    Args:
+        text: Contents of a configuration file
+
+    Returns:
+        The parsed data
+    """
+    if text.lstrip().startswith("{"):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return load_yaml(text)
+
+
+# Suffix of the JSON sidecar written next to each parsed YAML file
+JSON_CACHE_SUFFIX = ".jcache"
+
+
+def _read_yaml(path: pathlib.Path, stat: os.stat_result) -> typing.Any:
+    """Read a YAML file through its JSON sidecar cache.
+
+    The sidecar records the mtime and size of the YAML file it was built
+    from, and is only used while both still match. Otherwise the YAML is
+    parsed and the sidecar rewritten. Data that cannot be represented as
+    JSON (e.g. YAML timestamps) is never cached.
+
+    Args:
+        path: YAML file to read
+        stat: Result of stat() on the YAML file
+
+    Returns:
+        The parsed YAML data
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    sidecar = path.with_name(path.name + JSON_CACHE_SUFFIX)
+    source = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        cached = json.loads(sidecar.read_bytes())
+        if cached["source"] == source:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    text = path.read_text(encoding="utf-8")
+    data = parse_config_text(text)
+    if text.lstrip().startswith("{"):
+        # Already JSON, nothing to gain from a sidecar
+        return data
+
+    try:
+        payload = json.dumps({"source": source, "data": data})
+        if json.loads(payload)["data"] != data:
+            raise ValueError("data does not round-trip through JSON")
+        with open(sidecar, "w", encoding="utf-8", opener=private_opener) as f:
+            f.write(payload)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Not caching {path} as JSON: {e}")
+
+    return data
+
+
+# Parsed YAML files keyed by (path, mtime_ns, size), least recently used first
+_YAML_CACHE_SIZE = 100
+_yaml_cache: collections.OrderedDict[tuple[str, int, int], typing.Any] = (
+    collections.OrderedDict()
+)
+
+
+def _load_yaml_cached(path: pathlib.Path) -> typing.Any:
+    """Load a YAML file, reusing the parsed data while the file is unchanged.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        A deep copy of the parsed data, safe for the caller to mutate
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    if key in _yaml_cache:
+        _yaml_cache.move_to_end(key)
+    else:
+        _yaml_cache[key] = _read_yaml(path, stat)
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(_yaml_cache[key])
+
+
+def file_signature(path: pathlib.Path) -> tuple[int, int] | None:
+    """Get the (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Index signature that never matches a real file signature
+UNINDEXED = (-1, -1)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML parses."""
+    _yaml_cache.clear()
+
+
 # Repository configuration models
 class RemoteConfig(pydantic.BaseModel):
     """Configuration for a git remote."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     name: str
     url: str
     fetch_refs: list[str] = pydantic.Field(default_factory=lambda: ["refs/heads/*"])
@@ -65,6 +235,8 @@ class RemoteConfig(pydantic.BaseModel):
 class AuthMethod(pydantic.BaseModel):
     """Authentication method for git operations."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     type: str = "ssh_key"  # ssh_key, token, credential_helper
     ssh_key_path: str | None = None
     ssh_key_passphrase_env: str | None = None
@@ -73,9 +245,29 @@ class AuthMethod(pydantic.BaseModel):
     credential_helper: str | None = None
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile glob patterns into a single regex matching any of them.
+
+    Cached so that configurations sharing the same patterns share the
+    compiled regex.
+
+    Args:
+        patterns: Glob patterns to combine
+
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
 class BranchConfig(pydantic.BaseModel):
     """Branch filtering configuration."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     patterns: list[str] = pydantic.Field(default_factory=lambda: ["*"])
     exclude_patterns: list[str] = pydantic.Field(default_factory=list)
     max_branches: int = 100
@@ -92,10 +284,27 @@ class BranchConfig(pydantic.BaseModel):
                 raise ValueError(f"Invalid pattern: {pattern}") from e
         return v
 
+    def matches(self, branch: str) -> bool:
+        """Check whether a branch is selected by this configuration.
+
+        Args:
+            branch: Branch name to check
+
+        Returns:
+            True if the branch matches a pattern and no exclude pattern
+        """
+        include = _compile_globs(tuple(self.patterns))
+        if include is None or not include.match(branch):
+            return False
+        exclude = _compile_globs(tuple(self.exclude_patterns))
+        return exclude is None or not exclude.match(branch)
+
 
 class SyncConfig(pydantic.BaseModel):
     """Repository synchronization configuration."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     strategy: str = "fetch_all"  # fetch_all, fetch_recent, manual
     interval: str = "6h"  # 1h, 30m, 1d format
     recent_days: int | None = None
@@ -105,6 +314,8 @@ class SyncConfig(pydantic.BaseModel):
 class StorageConfig(pydantic.BaseModel):
     """Repository storage configuration."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     type: str = "bare"  # bare, full
     max_size: str | None = None  # "5GB", "1TB" format
     retention_days: int = 365
@@ -113,6 +324,8 @@ class StorageConfig(pydantic.BaseModel):
 class RepositoryConfig(pydantic.BaseModel):
     """Configuration for a single repository."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     name: str
     source: dict[str, typing.Any]  # URL, type
     remotes: list[RemoteConfig] = pydantic.Field(default_factory=list)
@@ -121,6 +334,10 @@ class RepositoryConfig(pydantic.BaseModel):
     storage: StorageConfig = pydantic.Field(default_factory=StorageConfig)
     auth_key: str | None = None  # Reference to auth.yaml entry
 
+    # Derived paths are computed on every access so that copies made with an
+    # updated source, and changes to the XDG directories, are always seen;
+    # url_to_path and the directory lookups are cached, so this stays cheap.
+    # joinpath builds one Path for all segments rather than one per "/".
     @property
     def url_path(self) -> str:
         """Generate URL-based path from source URL."""
@@ -129,7 +346,7 @@ class RepositoryConfig(pydantic.BaseModel):
     @property
     def repo_path(self) -> pathlib.Path:
         """Get full path to git repository (cache)."""
-        return get_cache_dir() / "repos" / self.url_path
+        return get_cache_dir().joinpath("repos", self.url_path)
 
     @property
     def state_path(self) -> pathlib.Path:
@@ -145,6 +362,46 @@ class GlobalConfig(pydantic.BaseModel):
     settings: dict[str, typing.Any] = pydantic.Field(default_factory=dict)
 
 
+def validate_repositories(
+    repos: list[RepositoryConfig], auth_config: dict[str, AuthMethod]
+) -> list[str]:
+    """Check repositories for duplicates and unknown auth references.
+
+    Runs in a single pass using set membership for every check.
+
+    Args:
+        repos: Repository configurations to check
+        auth_config: Known authentication methods keyed by auth key
+
+    Returns:
+        List of validation errors, empty if the repositories are valid
+    """
+    names: set[str] = set()
+    urls: set[typing.Any] = set()
+    duplicate_names = duplicate_urls = False
+    auth_errors = []
+    for repo in repos:
+        if repo.name in names:
+            duplicate_names = True
+        names.add(repo.name)
+        url = repo.source.get("url")
+        if url in urls:
+            duplicate_urls = True
+        urls.add(url)
+        if repo.auth_key and repo.auth_key not in auth_config:
+            auth_errors.append(
+                f"Repository '{repo.name}' references unknown auth key '{repo.auth_key}'"
+            )
+
+    errors = []
+    if duplicate_names:
+        errors.append("Duplicate repository names found")
+    if duplicate_urls:
+        errors.append("Duplicate repository URLs found")
+    errors.extend(auth_errors)
+    return errors
+
+
 class ConfigManager:
     """Manages repository configuration loading and validation."""
 
@@ -155,47 +412,102 @@ class ConfigManager:
         self.global_settings_file = self.config_dir / "global.yaml"
         self.auth_file = self.config_dir / "auth.yaml"
 
+        # Last validated configuration and repository lookup indexes,
+        # rebuilt whenever repos.yaml changes
+        self._validated: GlobalConfig | None = None
+        self._by_name: dict[str, RepositoryConfig] = {}
+        self._by_url_path: dict[str, RepositoryConfig] = {}
+        self._by_source_url: dict[str, RepositoryConfig] = {}
+        self._index_signature: tuple[int, int] | None = UNINDEXED
+
         # Ensure directories exist
         setup_secure_directories()
 
     def load_configuration(self) -> GlobalConfig:
         """Load and validate all configuration files."""
-        if not self.repositories_file.exists():
-            return GlobalConfig()
+        signature = file_signature(self.repositories_file)
+        if signature is None:
+            global_config = GlobalConfig()
+            self._index_repositories(global_config, signature)
+            return global_config
+
+        if signature == self._index_signature and self._validated is not None:
+            return self._copy_validated(self._validated)
 
         try:
-            with self.repositories_file.open(encoding="utf-8") as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _load_yaml_cached(self.repositories_file) or {}
 
-            return GlobalConfig(**config_data)
+            global_config = GlobalConfig(**config_data)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {self.repositories_file}: {e}") from e
         except Exception as e:
             raise ValueError(f"Error loading configuration: {e}") from e
 
+        self._index_repositories(global_config, signature)
+        return self._copy_validated(global_config)
+
+    @staticmethod
+    def _copy_validated(global_config: GlobalConfig) -> GlobalConfig:
+        """Build a caller-owned copy of an already validated configuration.
+
+        Uses model_construct to skip revalidation. The frozen repository
+        configs are shared, while the mutable containers are copied so
+        callers can edit the result without touching the cached one.
+        """
+        return GlobalConfig.model_construct(
+            _fields_set=global_config.model_fields_set,
+            version=global_config.version,
+            repos=list(global_config.repos),
+            settings=copy.deepcopy(global_config.settings),
+        )
+
+    def _index_repositories(
+        self, global_config: GlobalConfig, signature: tuple[int, int] | None
+    ) -> None:
+        """Build the repository lookup indexes from a loaded configuration.
+
+        Iterates in reverse so the first repository wins on duplicate keys,
+        matching a linear scan.
+        """
+        self._by_name = {}
+        self._by_url_path = {}
+        self._by_source_url = {}
+        for repo in reversed(global_config.repos):
+            self._by_name[repo.name] = repo
+            url = repo.source.get("url")
+            if url is not None:
+                self._by_source_url[url] = repo
+                self._by_url_path[repo.url_path] = repo
+        self._validated = global_config
+        self._index_signature = signature
+
+    def _refresh_index(self) -> None:
+        """Reload the configuration if repos.yaml changed since it was indexed."""
+        if file_signature(self.repositories_file) != self._index_signature:
+            self.load_configuration()
+
+    def _invalidate_index(self) -> None:
+        """Drop the validated configuration and repository lookup indexes."""
+        self._validated = None
+        self._by_name = {}
+        self._by_url_path = {}
+        self._by_source_url = {}
+        self._index_signature = UNINDEXED
+
     def get_repository_config(self, url_path: str) -> RepositoryConfig | None:
         """Get configuration for specific repository by URL path."""
-        config = self.load_configuration()
-        for repo in config.repos:
-            if repo.url_path == url_path:
-                return repo
-        return None
+        self._refresh_index()
+        return self._by_url_path.get(url_path)
 
     def get_repository_config_by_url(self, url: str) -> RepositoryConfig | None:
         """Get configuration for specific repository by source URL."""
-        config = self.load_configuration()
-        for repo in config.repos:
-            if repo.source.get("url") == url:
-                return repo
-        return None
+        self._refresh_index()
+        return self._by_source_url.get(url)
 
     def get_repository_config_by_name(self, name: str) -> RepositoryConfig | None:
         """Get configuration for specific repository by name."""
-        config = self.load_configuration()
-        for repo in config.repos:
-            if repo.name == name:
-                return repo
-        return None
+        self._refresh_index()
+        return self._by_name.get(name)
 
     def validate_configuration(self) -> list[str]:
         """Validate configuration and return list of errors."""
@@ -204,23 +516,8 @@ class ConfigManager:
         try:
             config = self.load_configuration()
 
-            # Check for duplicate repository names
-            names = [repo.name for repo in config.repos]
-            if len(names) != len(set(names)):
-                errors.append("Duplicate repository names found")
-
-            # Check for duplicate URLs
-            urls = [repo.source.get("url") for repo in config.repos]
-            if len(urls) != len(set(urls)):
-                errors.append("Duplicate repository URLs found")
-
-            # Validate auth references
             auth_config = self.load_auth_config()
-            for repo in config.repos:
-                if repo.auth_key and repo.auth_key not in auth_config:
-                    errors.append(
-                        f"Repository '{repo.name}' references unknown auth key '{repo.auth_key}'"
-                    )
+            errors.extend(validate_repositories(config.repos, auth_config))
 
         except Exception as e:
             errors.append(f"Configuration loading error: {e}")
@@ -229,6 +526,9 @@ class ConfigManager:
 
     def generate_default_config(self) -> None:
         """Generate default configuration files."""
+        clear_yaml_cache()
+        self._invalidate_index()
+
         # Create default repos.yaml
         default_config = {
             "version": "1.0",
@@ -243,7 +543,13 @@ class ConfigManager:
 
         if not self.repositories_file.exists():
             with self.repositories_file.open("w", encoding="utf-8") as f:
-                yaml.dump(default_config, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    default_config,
+                    f,
+                    Dumper=YAML_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                )
 
         # Create default global-settings.yaml
         default_global = {
@@ -266,7 +572,13 @@ class ConfigManager:
 
         if not self.global_settings_file.exists():
             with self.global_settings_file.open("w", encoding="utf-8") as f:
-                yaml.dump(default_global, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    default_global,
+                    f,
+                    Dumper=YAML_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                )
 
         # Create auth.yaml template (with restrictive permissions)
         auth_template = {
@@ -283,10 +595,12 @@ class ConfigManager:
             },
         }
 
+        # Written as JSON, which YAML loaders still accept, for faster loads
         if not self.auth_file.exists():
-            with self.auth_file.open("w", encoding="utf-8") as f:
-                yaml.dump(auth_template, f, default_flow_style=False, indent=2)
-            self.auth_file.chmod(0o600)  # Secure permissions
+            with open(
+                self.auth_file, "w", encoding="utf-8", opener=private_opener
+            ) as f:
+                json.dump(auth_template, f, indent=2)
 
     def load_auth_config(self) -> dict[str, AuthMethod]:
         """Load authentication configuration from auth.yaml."""
@@ -294,8 +608,7 @@ class ConfigManager:
             return {}
 
         try:
-            with self.auth_file.open(encoding="utf-8") as f:
-                auth_data = yaml.safe_load(f) or {}
+            auth_data = _load_yaml_cached(self.auth_file) or {}
 
             auth_methods = {}
             for key, method_data in auth_data.get("auth_methods", {}).items():
@@ -8,6 +8,7 @@ from loguru import logger
 from ca_bhfuil.core.managers import base as base_manager
 from ca_bhfuil.core.managers import repository as repository_manager
 from ca_bhfuil.storage import sqlmodel_manager
+from ca_bhfuil.storage.database import engine
 
 
 class ManagerFactory:
@@ -17,15 +18,19 @@ class ManagerFactory:
         self,
         db_path: pathlib.Path | None = None,
         shared_session: bool = True,
+        database_engine: engine.DatabaseEngine | None = None,
     ):
         """Initialize manager factory.
 
         Args:
             db_path: Optional database path override
             shared_session: Whether to use shared database session across managers
+            database_engine: Optional pre-built database engine to share between
+                factories; it stays open when the factory is closed
         """
         self._db_path = db_path
         self._shared_session = shared_session
+        self._database_engine = database_engine
         self._registry = base_manager.ManagerRegistry()
         self._db_manager: sqlmodel_manager.SQLModelDatabaseManager | None = None
         self._initialized = False
@@ -36,7 +41,9 @@ class ManagerFactory:
             return
 
         # Create and initialize database manager
-        self._db_manager = sqlmodel_manager.SQLModelDatabaseManager(self._db_path)
+        self._db_manager = sqlmodel_manager.SQLModelDatabaseManager(
+            self._db_path, self._database_engine
+        )
         await self._db_manager.initialize()
 
         # Set up shared database manager
@@ -1,5 +1,8 @@
 """Repository manager for orchestrating git operations and database persistence."""
 
+import asyncio
+import itertools
+import operator
 import pathlib
 import typing
 
@@ -15,6 +18,11 @@ from ca_bhfuil.storage.database import models as db_models
 from ca_bhfuil.storage.database import repository as db_repository
 
 
+# Column accessors for aggregating over commit lists with C-level builtins
+_author_name = operator.attrgetter("author_name")
+_author_date = operator.attrgetter("author_date")
+
+
 class RepositoryAnalysisResult(result_models.OperationResult):
     """Result of repository analysis with business-specific analytics."""
 
@@ -94,7 +102,7 @@ class RepositoryManager(base_manager.BaseManager):
 
         # Load from git and optionally cache
         logger.debug(f"Loading commits from git for {self.repository_path}")
-        git_commits = self._load_commits_from_git(limit)
+        git_commits = await asyncio.to_thread(self._load_commits_from_git, limit)
 
         if from_cache:
             # Store in database for future caching
@@ -119,10 +127,11 @@ class RepositoryManager(base_manager.BaseManager):
                 return []
 
             # Walk through all commits from HEAD, no artificial limits
+            matcher = commit_models.compile_pattern(pattern)
             matching_commits = []
             for commit in self._git_repo._repo.walk(self._git_repo._repo.head.target):
                 commit_info = self._git_repo._commit_to_model(commit)
-                if commit_info.matches_pattern(pattern):
+                if matcher(commit_info):
                     matching_commits.append(commit_info)
 
             return matching_commits
@@ -155,8 +164,9 @@ class RepositoryManager(base_manager.BaseManager):
                 logger.debug(f"Loaded {len(db_commits)} commits from database cache")
 
                 # Search in database cache
+                matcher = commit_models.compile_pattern(pattern)
                 db_matching_commits = [
-                    commit for commit in db_commits if commit.matches_pattern(pattern)
+                    commit for commit in db_commits if matcher(commit)
                 ]
                 logger.debug(
                     f"Found {len(db_matching_commits)} matching commits in database cache"
@@ -183,7 +193,9 @@ class RepositoryManager(base_manager.BaseManager):
                 logger.debug(
                     "Database cache insufficient, searching entire git history"
                 )
-                all_matching_commits = self._search_all_commits_from_git(pattern)
+                all_matching_commits = await asyncio.to_thread(
+                    self._search_all_commits_from_git, pattern
+                )
                 logger.debug(
                     f"Found {len(all_matching_commits)} matching commits in full git history"
                 )
@@ -242,13 +254,12 @@ class RepositoryManager(base_manager.BaseManager):
                 ]
 
                 # Get unique authors
-                authors = list({commit.author_name for commit in commits})
+                authors = list(set(map(_author_name, commits)))
 
                 # Calculate date range
-                dates = [commit.author_date for commit in commits]
                 date_range = {
-                    "earliest": min(dates).isoformat(),
-                    "latest": max(dates).isoformat(),
+                    "earliest": min(map(_author_date, commits)).isoformat(),
+                    "latest": max(map(_author_date, commits)).isoformat(),
                 }
 
                 # Get git statistics for branch count
@@ -306,20 +317,12 @@ class RepositoryManager(base_manager.BaseManager):
                     raise RuntimeError("Repository ID is None after creation/retrieval")
 
                 # Load fresh commits from git
-                git_commits = self._load_commits_from_git(limit=1000)
-
-                # Sync commits to database
-                synced_count = 0
-                for commit in git_commits:
-                    # Check if commit already exists
-                    existing = await db_repo.commits.get_by_sha(
-                        repository_id, commit.sha
-                    )
-                    if not existing:
-                        # Create new commit record
-                        commit_create = commit.to_db_create(repository_id)
-                        await db_repo.commits.create(commit_create)
-                        synced_count += 1
+                git_commits = await asyncio.to_thread(self._load_commits_from_git, 1000)
+
+                # Sync commits to database in a single batched insert
+                synced_count = await db_repo.commits.insert_missing(
+                    [commit.to_db_create(repository_id) for commit in git_commits]
+                )
 
                 # Update repository statistics
                 git_stats = self._git_repo.get_repository_stats()
@@ -352,14 +355,10 @@ class RepositoryManager(base_manager.BaseManager):
                 return []
 
             # Walk through commits from HEAD
-            commits = []
-            for commit in self._git_repo._repo.walk(self._git_repo._repo.head.target):
-                commit_info = self._git_repo._commit_to_model(commit)
-                commits.append(commit_info)
-                if len(commits) >= limit:
-                    break
-
-            return commits
+            walker = self._git_repo._repo.walk(self._git_repo._repo.head.target)
+            return list(
+                map(self._git_repo._commit_to_model, itertools.islice(walker, limit))
+            )
 
         except Exception as e:
             logger.error(f"Failed to load commits from git: {e}")
@@ -401,17 +400,10 @@ class RepositoryManager(base_manager.BaseManager):
                     logger.error("Repository ID is None, cannot cache commits")
                     return
 
-                # Cache commits
-                cached_count = 0
-                for commit in commits:
-                    # Check if commit already exists
-                    existing = await db_repo.commits.get_by_sha(
-                        repository_id, commit.sha
-                    )
-                    if not existing:
-                        commit_create = commit.to_db_create(repository_id)
-                        await db_repo.commits.create(commit_create)
-                        cached_count += 1
+                # Cache commits in a single batched insert
+                cached_count = await db_repo.commits.insert_missing(
+                    [commit.to_db_create(repository_id) for commit in commits]
+                )
 
                 logger.debug(f"Cached {cached_count} commits to database")
 
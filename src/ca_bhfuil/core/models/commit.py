@@ -1,6 +1,7 @@
 """Commit-related data models."""
 
 import datetime
+import functools
 import typing
 
 import pydantic
@@ -14,7 +15,7 @@ if typing.TYPE_CHECKING:
 class CommitInfo(pydantic.BaseModel):
     """Information about a git commit."""
 
-    model_config = pydantic.ConfigDict()
+    model_config = pydantic.ConfigDict(frozen=True)
 
     sha: str = pydantic.Field(..., description="Full commit SHA hash")
     short_sha: str = pydantic.Field(
@@ -115,6 +116,25 @@ class CommitInfo(pydantic.BaseModel):
         )
 
     # Business Logic Methods
+    @property
+    def search_text(self) -> str:
+        """Lowercased searchable fields, joined with NUL separators.
+
+        Matching a pattern costs a single substring scan of this text
+        instead of one per field. It is rebuilt on every access rather than
+        cached, because model_copy carries cached values over to copies
+        made with updated fields. NUL cannot appear in git metadata, so a
+        pattern never matches across two fields.
+        """
+        fields = (
+            self.sha,
+            self.short_sha,
+            self.message,
+            self.author_name,
+            self.author_email,
+        )
+        return "\0".join(fields).lower()
+
     def matches_pattern(self, pattern: str) -> bool:
         """Check if this commit matches a search pattern.
 
@@ -128,14 +148,7 @@ class CommitInfo(pydantic.BaseModel):
             Searches in commit SHA, short SHA, commit message, author name, and author email.
             Case-insensitive matching.
         """
-        pattern_lower = pattern.lower()
-        return (
-            pattern_lower in self.sha.lower()
-            or pattern_lower in self.short_sha.lower()
-            or pattern_lower in self.message.lower()
-            or pattern_lower in self.author_name.lower()
-            or pattern_lower in self.author_email.lower()
-        )
+        return compile_pattern(pattern)(self)
 
     def calculate_impact_score(self) -> float:
         """Calculate a normalized impact score for this commit.
@@ -203,3 +216,28 @@ class CommitInfo(pydantic.BaseModel):
             message = message[:57] + "..."
 
         return f"{impact_indicator} {self.short_sha} {message} ({self.author_name})"
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> typing.Callable[[CommitInfo], bool]:
+    """Build a reusable case-insensitive matcher for a search pattern.
+
+    Patterns are plain substrings, so the pattern is lowercased once here
+    and each commit costs a single ``in`` test against its search_text.
+    Matchers are cached for patterns that are searched repeatedly.
+
+    Args:
+        pattern: Search pattern to match against
+
+    Returns:
+        Function returning True for commits that match the pattern
+    """
+    needle = pattern.lower()
+    if "\0" in needle:
+        # search_text uses NUL as its field separator
+        return lambda _commit: False
+
+    def matcher(commit: CommitInfo) -> bool:
+        return needle in commit.search_text
+
+    return matcher
@@ -1,6 +1,7 @@
 """Database engine and session management for SQLModel."""
 
 import contextlib
+import os
 import pathlib
 import typing
 
@@ -11,6 +12,50 @@ import sqlalchemy.ext.asyncio
 from ca_bhfuil.core import config
 
 
+# Applied to every new SQLite connection. WAL with synchronous=NORMAL only
+# syncs at checkpoints rather than on every commit, and is still durable
+# against application crashes.
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+}
+
+# Environment variable that switches new connections to FAST_SQLITE_PRAGMAS.
+FAST_PRAGMAS_ENV = "CA_BHFUIL_TEST_FAST"
+
+# Throwaway databases (e.g. in the test suite) skip fsync and keep the
+# rollback journal in memory. Not crash safe.
+FAST_SQLITE_PRAGMAS: dict[str, str | int] = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY",
+}
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: typing.Any, _connection_record: typing.Any
+) -> None:
+    """Apply SQLITE_PRAGMAS to a new DBAPI connection.
+
+    FAST_SQLITE_PRAGMAS are used instead when FAST_PRAGMAS_ENV is set.
+
+    Args:
+        dbapi_connection: Raw DBAPI connection being opened
+        _connection_record: Pool connection record (unused)
+    """
+    pragmas = (
+        FAST_SQLITE_PRAGMAS if os.environ.get(FAST_PRAGMAS_ENV) else SQLITE_PRAGMAS
+    )
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 class DatabaseEngine:
     """Manages SQLAlchemy engine and session creation for SQLModel."""
 
@@ -49,6 +94,9 @@ class DatabaseEngine:
                     "timeout": 30,
                 },
             )
+            sqlalchemy.event.listen(
+                self._engine.sync_engine, "connect", _set_sqlite_pragmas
+            )
             logger.debug("Created async SQLAlchemy engine")
         return self._engine
 
@@ -66,6 +114,7 @@ class DatabaseEngine:
                     "timeout": 30,
                 },
             )
+            sqlalchemy.event.listen(self._sync_engine, "connect", _set_sqlite_pragmas)
             logger.debug("Created sync SQLAlchemy engine")
         return self._sync_engine
 
@@ -206,10 +206,19 @@ class KGEdge(TimestampMixin, table=True):
     )
 
 
+# Read models are snapshots of stored rows and are never modified, so they
+# are frozen. The table models above stay mutable because the ORM assigns
+# primary keys and timestamps on flush.
+_READ_MODEL_CONFIG = sqlmodel.SQLModel.model_config.copy()
+_READ_MODEL_CONFIG["frozen"] = True
+
+
 # Pydantic models for API responses (without table=True)
 class RepositoryRead(sqlmodel.SQLModel):
     """Repository read model for API responses."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: int
     path: str
     name: str
@@ -223,6 +232,8 @@ class RepositoryRead(sqlmodel.SQLModel):
 class CommitRead(sqlmodel.SQLModel):
     """Commit read model for API responses."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: int
     repository_id: int
     sha: str
@@ -243,6 +254,8 @@ class CommitRead(sqlmodel.SQLModel):
 class BranchRead(sqlmodel.SQLModel):
     """Branch read model for API responses."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: int
     repository_id: int
     name: str
@@ -5,6 +5,7 @@ import typing
 
 from loguru import logger
 import sqlalchemy
+from sqlalchemy.dialects import sqlite
 import sqlalchemy.ext.asyncio
 import sqlmodel
 
@@ -108,6 +109,52 @@ class RepositoryRepository(BaseRepository):
             logger.debug(f"Updated repository stats: {repo.path}")
         return repo
 
+    async def bulk_update_stats(
+        self, stats: typing.Sequence[tuple[int, int, int]]
+    ) -> None:
+        """Update statistics for several repositories in one transaction.
+
+        The rows are sent as a single executemany UPDATE by primary key and
+        committed once.
+
+        Args:
+            stats: (repository ID, commit count, branch count) for each
+                repository
+        """
+        if not stats:
+            return
+
+        now = datetime.datetime.utcnow()
+        await self.session.execute(
+            sqlalchemy.update(models.Repository),
+            [
+                {
+                    "id": repo_id,
+                    "commit_count": commit_count,
+                    "branch_count": branch_count,
+                    "last_analyzed": now,
+                }
+                for repo_id, commit_count, branch_count in stats
+            ],
+        )
+        await self.session.commit()
+        logger.debug(f"Updated stats for {len(stats)} repositories")
+
+    async def get_ids_by_path(self, paths: typing.Iterable[str]) -> dict[str, int]:
+        """Get the IDs of the repositories stored at the given paths.
+
+        Args:
+            paths: Repository paths
+
+        Returns:
+            Repository IDs keyed by path, for the paths that are stored
+        """
+        statement = sqlmodel.select(models.Repository.path, models.Repository.id).where(
+            models.Repository.path.in_(list(paths))  # type: ignore[attr-defined]
+        )
+        result = await self.session.execute(statement)
+        return dict(result.tuples().all())
+
     async def list_all(self) -> list[models.Repository]:
         """List all repositories.
 
@@ -136,6 +183,69 @@ class CommitRepository(BaseRepository):
         logger.debug(f"Created commit: {commit.short_sha}")
         return commit
 
+    async def bulk_create(self, commits: list[models.CommitCreate]) -> list[int]:
+        """Create commits in one transaction.
+
+        Rows are sent as batched multi-row INSERT statements, which
+        SQLAlchemy splits to stay within SQLite's bound parameter limit,
+        and committed once.
+
+        Args:
+            commits: Commit creation data
+
+        Returns:
+            IDs of the created commits, in the order given
+        """
+        if not commits:
+            return []
+
+        statement = sqlite.insert(models.Commit).returning(  # type: ignore[call-overload]
+            models.Commit.id, sort_by_parameter_order=True
+        )
+        result = await self.session.execute(statement, self._rows(commits))
+        commit_ids = list(result.scalars())
+        await self.session.commit()
+
+        logger.debug(f"Created {len(commit_ids)} commits")
+        return commit_ids
+
+    async def insert_missing(self, commits: list[models.CommitCreate]) -> int:
+        """Insert commits in one transaction, skipping any already stored.
+
+        Rows are sent as batched multi-row INSERT ... ON CONFLICT DO NOTHING
+        statements against the (repository_id, sha) unique constraint and
+        committed once. RETURNING reports which rows were actually inserted.
+
+        Args:
+            commits: Commit creation data
+
+        Returns:
+            Number of commits inserted
+        """
+        if not commits:
+            return 0
+
+        statement = (
+            sqlite.insert(models.Commit)
+            .on_conflict_do_nothing()
+            .returning(models.Commit.id)  # type: ignore[call-overload]
+        )
+        result = await self.session.execute(statement, self._rows(commits))
+        inserted = len(result.all())
+        await self.session.commit()
+
+        logger.debug(f"Inserted {inserted} of {len(commits)} commits")
+        return inserted
+
+    @staticmethod
+    def _rows(commits: list[models.CommitCreate]) -> list[dict[str, typing.Any]]:
+        """Build INSERT parameter rows for commits, stamped with the current time."""
+        now = datetime.datetime.utcnow()
+        return [
+            {**commit.model_dump(), "created_at": now, "updated_at": now}
+            for commit in commits
+        ]
+
     async def get_by_sha(self, repository_id: int, sha: str) -> models.Commit | None:
         """Get commit by SHA.
 
@@ -198,6 +308,51 @@ class CommitRepository(BaseRepository):
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def find_commits_by_patterns(
+        self,
+        repository_id: int,
+        sha_patterns: typing.Sequence[str] = (),
+        message_patterns: typing.Sequence[str] = (),
+        limit: int = 100,
+    ) -> list[models.Commit]:
+        """Find commits matching any of several patterns in one query.
+
+        Patterns are matched as literal substrings, so ``%`` and ``_`` in a
+        pattern are not treated as wildcards.
+
+        Args:
+            repository_id: Repository ID
+            sha_patterns: SHA patterns to match
+            message_patterns: Message patterns to match
+            limit: Maximum results, shared by all patterns
+
+        Returns:
+            List of commits matching at least one pattern
+        """
+        conditions = [
+            column.contains(pattern, autoescape=True)  # type: ignore[attr-defined]
+            for pattern in sha_patterns
+            for column in (models.Commit.sha, models.Commit.short_sha)
+        ]
+        conditions.extend(
+            models.Commit.message.contains(pattern, autoescape=True)  # type: ignore[attr-defined]
+            for pattern in message_patterns
+        )
+        if not conditions:
+            return []
+
+        statement = (
+            sqlmodel.select(models.Commit)
+            .where(
+                models.Commit.repository_id == repository_id,
+                sqlmodel.or_(*conditions),
+            )
+            .order_by(sqlalchemy.desc(models.Commit.author_date))
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
     async def get_by_repository(
         self, repository_id: int, limit: int = 100
     ) -> list[models.Commit]:
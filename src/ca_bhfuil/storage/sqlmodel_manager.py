@@ -1,9 +1,11 @@
 """SQLModel-based database manager replacing the old async_database.py."""
 
+import contextlib
 import pathlib
 import typing
 
 from loguru import logger
+import sqlalchemy.ext.asyncio
 
 from ca_bhfuil.storage import alembic_interface
 from ca_bhfuil.storage.database import engine
@@ -14,13 +16,22 @@ from ca_bhfuil.storage.database import repository
 class SQLModelDatabaseManager:
     """Manages database operations using SQLModel and async SQLAlchemy."""
 
-    def __init__(self, db_path: pathlib.Path | None = None):
+    def __init__(
+        self,
+        db_path: pathlib.Path | None = None,
+        database_engine: engine.DatabaseEngine | None = None,
+    ):
         """Initialize SQLModel database manager.
 
         Args:
             db_path: Optional database path override
+            database_engine: Optional pre-built engine to share; the caller
+                owns it and it is not closed by this manager
         """
-        self.engine = engine.get_database_engine(db_path)
+        self._owns_engine = database_engine is None
+        self.engine = database_engine or engine.get_database_engine(db_path)
+        # Session shared by every operation while inside transaction()
+        self._session: sqlalchemy.ext.asyncio.AsyncSession | None = None
         logger.debug(
             f"Initialized SQLModel database manager with {self.engine.db_path}"
         )
@@ -33,7 +44,42 @@ class SQLModelDatabaseManager:
 
     async def close(self) -> None:
         """Close database connections."""
-        await self.engine.close()
+        if self._owns_engine:
+            await self.engine.close()
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> typing.AsyncIterator["SQLModelDatabaseManager"]:
+        """Run several manager operations in a single database transaction.
+
+        The yielded manager routes every operation through one session bound
+        to a connection with an open transaction. Commits made by the
+        repositories do not end that outer transaction, so everything is
+        committed once on exit, or rolled back if the block raises.
+
+        Yields:
+            Manager whose operations share the transaction
+        """
+        async with (
+            self.engine.engine.connect() as connection,
+            connection.begin(),
+            sqlalchemy.ext.asyncio.AsyncSession(
+                connection, expire_on_commit=False
+            ) as session,
+        ):
+            scoped = SQLModelDatabaseManager(database_engine=self.engine)
+            scoped._session = session
+            yield scoped
+
+    @contextlib.asynccontextmanager
+    async def _get_session(
+        self,
+    ) -> typing.AsyncIterator[sqlalchemy.ext.asyncio.AsyncSession]:
+        """Get the transaction's session, or a new session outside one."""
+        if self._session is not None:
+            yield self._session
+            return
+        async with self.engine.get_session() as session:
+            yield session
 
     async def add_repository(self, path: str, name: str) -> int:
         """Add a repository to the database.
@@ -45,7 +91,7 @@ class SQLModelDatabaseManager:
         Returns:
             Repository ID
         """
-        async with self.engine.get_session() as session:
+        async with self._get_session() as session:
             db_repo = repository.DatabaseRepository(session)
 
             # Check if repository already exists
@@ -67,36 +113,57 @@ class SQLModelDatabaseManager:
         Returns:
             Repository data or None
         """
-        async with self.engine.get_session() as session:
+        async with self._get_session() as session:
             db_repo = repository.DatabaseRepository(session)
             repo = await db_repo.repositories.get_by_path(path)
 
-            if repo:
-                return models.RepositoryRead(
-                    id=repo.id or 0,
-                    path=repo.path,
-                    name=repo.name,
-                    last_analyzed=repo.last_analyzed,
-                    commit_count=repo.commit_count,
-                    branch_count=repo.branch_count,
-                    created_at=repo.created_at,
-                    updated_at=repo.updated_at,
-                )
-            return None
+            return self._repository_read(repo) if repo else None
 
     async def update_repository_stats(
         self, repo_id: int, commit_count: int, branch_count: int
-    ) -> None:
+    ) -> models.RepositoryRead | None:
         """Update repository statistics.
 
         Args:
             repo_id: Repository ID
             commit_count: Number of commits
             branch_count: Number of branches
+
+        Returns:
+            Updated repository data or None if not found
         """
-        async with self.engine.get_session() as session:
+        async with self._get_session() as session:
             db_repo = repository.DatabaseRepository(session)
-            await db_repo.repositories.update_stats(repo_id, commit_count, branch_count)
+            repo = await db_repo.repositories.update_stats(
+                repo_id, commit_count, branch_count
+            )
+            return self._repository_read(repo) if repo else None
+
+    async def update_repository_stats_bulk(
+        self, stats: typing.Sequence[tuple[int, int, int]]
+    ) -> None:
+        """Update statistics for several repositories in one transaction.
+
+        Args:
+            stats: (repository ID, commit count, branch count) for each
+                repository
+        """
+        async with self._get_session() as session:
+            db_repo = repository.DatabaseRepository(session)
+            await db_repo.repositories.bulk_update_stats(stats)
+
+    async def get_repository_ids(self, paths: typing.Iterable[str]) -> dict[str, int]:
+        """Get the IDs of the repositories stored at the given paths.
+
+        Args:
+            paths: Repository paths
+
+        Returns:
+            Repository IDs keyed by path, for the paths that are stored
+        """
+        async with self._get_session() as session:
+            db_repo = repository.DatabaseRepository(session)
+            return await db_repo.repositories.get_ids_by_path(paths)
 
     async def add_commit(
         self, repository_id: int, commit_data: dict[str, typing.Any]
@@ -110,7 +177,7 @@ class SQLModelDatabaseManager:
         Returns:
             Commit ID
         """
-        async with self.engine.get_session() as session:
+        async with self._get_session() as session:
             db_repo = repository.DatabaseRepository(session)
 
             # Check if commit already exists
@@ -157,32 +224,48 @@ class SQLModelDatabaseManager:
         Returns:
             List of matching commits
         """
-        async with self.engine.get_session() as session:
+        async with self._get_session() as session:
             db_repo = repository.DatabaseRepository(session)
             commits = await db_repo.commits.find_commits(
                 repository_id, sha_pattern, message_pattern, limit
             )
 
-            return [
-                models.CommitRead(
-                    id=commit.id or 0,
-                    repository_id=commit.repository_id,
-                    sha=commit.sha,
-                    short_sha=commit.short_sha,
-                    message=commit.message,
-                    author_name=commit.author_name,
-                    author_email=commit.author_email,
-                    author_date=commit.author_date,
-                    committer_name=commit.committer_name,
-                    committer_email=commit.committer_email,
-                    committer_date=commit.committer_date,
-                    files_changed=commit.files_changed,
-                    insertions=commit.insertions,
-                    deletions=commit.deletions,
-                    created_at=commit.created_at,
-                )
-                for commit in commits
-            ]
+            return [self._commit_read(commit) for commit in commits]
+
+    @staticmethod
+    def _repository_read(repo: models.Repository) -> models.RepositoryRead:
+        """Build the read model for a stored repository."""
+        return models.RepositoryRead(
+            id=repo.id or 0,
+            path=repo.path,
+            name=repo.name,
+            last_analyzed=repo.last_analyzed,
+            commit_count=repo.commit_count,
+            branch_count=repo.branch_count,
+            created_at=repo.created_at,
+            updated_at=repo.updated_at,
+        )
+
+    @staticmethod
+    def _commit_read(commit: models.Commit) -> models.CommitRead:
+        """Build the read model for a stored commit."""
+        return models.CommitRead(
+            id=commit.id or 0,
+            repository_id=commit.repository_id,
+            sha=commit.sha,
+            short_sha=commit.short_sha,
+            message=commit.message,
+            author_name=commit.author_name,
+            author_email=commit.author_email,
+            author_date=commit.author_date,
+            committer_name=commit.committer_name,
+            committer_email=commit.committer_email,
+            committer_date=commit.committer_date,
+            files_changed=commit.files_changed,
+            insertions=commit.insertions,
+            deletions=commit.deletions,
+            created_at=commit.created_at,
+        )
 
     async def get_stats(self) -> dict[str, typing.Any]:
         """Get database statistics.
@@ -190,7 +273,7 @@ class SQLModelDatabaseManager:
         Returns:
             Database statistics
         """
-        async with self.engine.get_session() as session:
+        async with self._get_session() as session:
             db_repo = repository.DatabaseRepository(session)
             return await db_repo.get_stats()
 
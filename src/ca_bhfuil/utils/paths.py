@@ -8,6 +8,23 @@ from urllib import parse
 from ca_bhfuil.core import config
 
 
+# Single-pass parser for the supported repository URL forms:
+#   git@host:owner/repo.git, http(s)://host/owner/repo.git, file:///path/repo
+# Any .git suffix, and the query or fragment of http(s)/file URLs, is dropped.
+_URL_RE = re.compile(
+    r"""
+    ^(?:
+        git@(?P<ssh_host>[^:]+):(?P<ssh_path>.+?)(?:\.git)?
+      | (?i:https?)://(?P<http_host>[^/?\#]*)/*
+        (?P<http_path>[^?\#]*?)(?:\.git)?(?:[?\#].*)?
+      | (?i:file)://[^/?\#]*/*
+        (?P<file_path>[^?\#]*?)(?:\.git)?(?:[?\#].*)?
+    )$
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
 def url_to_path(url: str) -> str:
     """Convert repository URL to filesystem path.
 
@@ -23,24 +40,14 @@ def url_to_path(url: str) -> str:
         >>> url_to_path("https://github.com/django/django.git")
         'github.com/django/django'
     """
-    # Handle SSH format: git@github.com:owner/repo.git
-    if url.startswith("git@"):
-        match = re.match(r"git@([^:]+):(.+?)(?:\.git)?$", url)
-        if match:
-            host, path = match.groups()
-            return f"{host}/{path}"
-    else:
-        # Handle HTTP/HTTPS format
-        parsed = parse.urlparse(url)
-        if parsed.scheme in ("http", "https"):
-            # Remove leading slash and .git suffix
-            path = parsed.path.lstrip("/").removesuffix(".git")
-            return f"{parsed.netloc}/{path}"
-        if parsed.scheme == "file":
-            # Handle file:// URLs for local testing
-            # Convert file:///path/to/repo to localhost/path/to/repo
-            path = parsed.path.lstrip("/").removesuffix(".git")
-            return f"localhost/{path}"
+    match = _URL_RE.match(url)
+    if match:
+        if match["ssh_host"] is not None:
+            return f"{match['ssh_host']}/{match['ssh_path']}"
+        if match["http_host"] is not None:
+            return f"{match['http_host']}/{match['http_path']}"
+        # Convert file:///path/to/repo to localhost/path/to/repo for testing
+        return f"localhost/{match['file_path']}"
 
     raise ValueError(f"Unsupported URL format: {url}")
 
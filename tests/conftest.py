@@ -1,5 +1,25 @@
 """Pytest configuration and shared fixtures."""
 
+import pytest
+
+from ca_bhfuil.storage.database import engine
+
 # Import all fixtures from the fixtures module to make them available
-from tests.fixtures.async_fixtures import *  # noqa: F401, F403
+from tests.fixtures.alembic import *  # noqa: F401, F403
+from tests.fixtures.managers import *  # noqa: F401, F403
 from tests.fixtures.repositories import *  # noqa: F401, F403
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_database_pragmas():
+    """Open every test database with the fsync-free SQLite pragmas.
+
+    Test databases are thrown away, so durability only costs time. The
+    variable is set in os.environ, so alembic subprocesses started by the
+    fixtures inherit it too; their env.py builds its own engine, though,
+    so migrations run with SQLite's defaults. Tests that check the
+    production pragmas can unset the variable with monkeypatch.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(engine.FAST_PRAGMAS_ENV, "1")
+        yield
@@ -2,6 +2,7 @@
 
 import asyncio
 from contextlib import asynccontextmanager
+import functools
 import os
 import pathlib
 import subprocess
@@ -9,52 +10,69 @@ import sys
 import tempfile
 import typing
 
+from alembic import config as alembic_config
+from alembic import script as alembic_script
+from alembic.runtime import migration
 from loguru import logger
 import pytest
+import sqlalchemy
+import sqlmodel
 
+from ca_bhfuil.storage.database import models  # noqa: F401
 
-async def run_alembic_command(
-    command: str, db_path: pathlib.Path | None = None
-) -> tuple[int, str, str]:
-    """Run an alembic command for the given database.
+
+ALEMBIC_INI = pathlib.Path(__file__).parents[2] / "alembic.ini"
+
+
+def _alembic_environment(db_path: pathlib.Path | None = None) -> dict[str, str]:
+    """Build the environment for running alembic against a database.
 
     Args:
-        command: Alembic command to run (e.g., "upgrade head")
         db_path: Optional database path override
 
     Returns:
-        Tuple of (return_code, stdout, stderr)
+        Environment variables for the alembic subprocess
     """
-    # Set up environment for alembic to use the specified database
-    env = {}
+    # Get the current environment and point alembic at the database
+    env = os.environ.copy()
     if db_path:
         # Ensure the database directory exists
         db_path.parent.mkdir(parents=True, exist_ok=True)
         # Set environment variable for alembic to use this database
         env["CA_BHFUIL_DB_PATH"] = str(db_path)
 
-    # Run alembic command with proper environment
-    full_command = f"alembic {command}"
-    logger.debug(f"Running alembic command: {full_command}")
-
-    # Get the current environment and add the .venv/bin path
-    current_env = os.environ.copy()
-    if env:
-        current_env.update(env)
-
     # Add the virtual environment's bin directory to PATH if we're in a virtual env
     if hasattr(sys, "real_prefix") or (
         hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
     ):
         venv_bin = pathlib.Path(sys.prefix) / "bin"
         if venv_bin.exists():
-            current_env["PATH"] = f"{venv_bin}:{current_env.get('PATH', '')}"
+            env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+
+    return env
+
+
+async def run_alembic_command(
+    command: str, db_path: pathlib.Path | None = None
+) -> tuple[int, str, str]:
+    """Run an alembic command for the given database.
+
+    Args:
+        command: Alembic command to run (e.g., "upgrade head")
+        db_path: Optional database path override
+
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    # Run alembic command with proper environment
+    full_command = f"alembic {command}"
+    logger.debug(f"Running alembic command: {full_command}")
 
     process = await asyncio.create_subprocess_shell(
         full_command,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        env=current_env,
+        env=_alembic_environment(db_path),
         cwd=pathlib.Path.cwd(),  # Ensure we're in the project directory
     )
 
@@ -101,6 +119,56 @@ async def create_test_database(db_path: pathlib.Path | None = None) -> pathlib.P
     return db_path
 
 
+@functools.cache
+def migrated_database_bytes() -> bytes:
+    """Get the contents of a database with the current schema at alembic head.
+
+    The tables are created directly from the SQLModel metadata and the
+    alembic head revision is stamped, instead of replaying every migration,
+    so managers that run ``alembic upgrade head`` against a copy find nothing
+    to do. The result is cached for the test process and, with no event loop
+    involved, can be used from both sync and async tests. Under pytest-xdist
+    every worker is its own process, so each builds the template once and
+    never shares a database file with another worker. Tests that exercise
+    the migrations themselves should use create_test_database().
+
+    Returns:
+        Raw SQLite database file contents
+    """
+    script_directory = alembic_script.ScriptDirectory.from_config(
+        alembic_config.Config(str(ALEMBIC_INI))
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = pathlib.Path(temp_dir) / "template.db"
+        logger.debug(f"Creating template test database at {db_path}")
+
+        sync_engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+        try:
+            with sync_engine.begin() as connection:
+                sqlmodel.SQLModel.metadata.create_all(connection)
+                context = migration.MigrationContext.configure(connection)
+                context.stamp(script_directory, "head")
+        finally:
+            sync_engine.dispose()
+
+        return db_path.read_bytes()
+
+
+def copy_test_database(db_path: pathlib.Path) -> pathlib.Path:
+    """Create a test database by copying the cached migrated template.
+
+    Args:
+        db_path: Path to write the database to
+
+    Returns:
+        Path to the created database
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db_path.write_bytes(migrated_database_bytes())
+    return db_path
+
+
 async def reset_test_database(db_path: pathlib.Path) -> None:
     """Reset a test database by dropping and recreating all tables.
 
@@ -236,3 +304,16 @@ async def verified_alembic_database():
         if not is_current:
             raise RuntimeError("Database schema verification failed")
         yield db_path
+
+
+@pytest.fixture
+def migrated_db(tmp_path):
+    """Pytest fixture for a migrated database copied from the cached template.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture
+
+    Returns:
+        Path to the database file
+    """
+    return copy_test_database(tmp_path / "test.db")
@@ -1,13 +0,0 @@
-"""Async test fixtures."""
-
-import asyncio
-
-import pytest
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
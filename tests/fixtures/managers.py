@@ -0,0 +1,111 @@
+"""Manager test fixtures for ca-bhfuil."""
+
+import collections.abc
+import contextlib
+import pathlib
+import unittest.mock
+
+import pytest
+import sqlmodel
+
+from ca_bhfuil.core.git import repository as git_repository
+from ca_bhfuil.core.managers import factory as manager_factory
+from ca_bhfuil.storage.database import engine
+from tests.fixtures import alembic
+
+
+@contextlib.asynccontextmanager
+async def make_factory(
+    db_path: pathlib.Path | None = None,
+    database_engine: engine.DatabaseEngine | None = None,
+) -> collections.abc.AsyncIterator[manager_factory.ManagerFactory]:
+    """Create an initialized manager factory and close it on exit.
+
+    Importing the factory module here also loads the git, database and
+    SQLAlchemy modules at collection time rather than in the first test.
+
+    Args:
+        db_path: Path to a migrated test database
+        database_engine: Optional shared database engine
+
+    Yields:
+        Initialized ManagerFactory instance
+    """
+    factory = manager_factory.ManagerFactory(db_path, database_engine=database_engine)
+    await factory.initialize()
+    try:
+        yield factory
+    finally:
+        await factory.close()
+
+
+@pytest.fixture(scope="session")
+async def shared_database_engine(tmp_path_factory):
+    """Provide one database engine shared by manager tests for the session.
+
+    Reusing the engine keeps its connection pool warm across factories.
+    Tests that exercise engine lifecycle should build their own factory.
+
+    Args:
+        tmp_path_factory: Pytest session temporary directory factory
+
+    Yields:
+        DatabaseEngine bound to a migrated session database
+    """
+    db_path = tmp_path_factory.mktemp("shared") / "shared.db"
+    database_engine = engine.DatabaseEngine(alembic.copy_test_database(db_path))
+    yield database_engine
+    await database_engine.close()
+
+
+@pytest.fixture
+async def clean_database_engine(shared_database_engine):
+    """Provide the shared database engine with every table emptied.
+
+    Factories on the shared engine write through to one session database,
+    so rows left by an earlier test (e.g. from sync_with_database) are
+    removed first.
+
+    Args:
+        shared_database_engine: Session-scoped shared database engine
+
+    Returns:
+        The shared DatabaseEngine with empty tables
+    """
+    async with shared_database_engine.get_session() as session:
+        for table in reversed(sqlmodel.SQLModel.metadata.sorted_tables):
+            await session.execute(table.delete())
+        await session.commit()
+    return shared_database_engine
+
+
+@pytest.fixture
+def mock_repo():
+    """Provide a fresh git repository mock for each test.
+
+    Returns:
+        MagicMock configured as a non-empty git repository.
+    """
+    repo = unittest.mock.MagicMock()
+    repo.head_is_unborn = False
+    repo.get_repository_stats.return_value = {"total_branches": 1}
+    return repo
+
+
+@pytest.fixture
+def mock_repo_class(monkeypatch, mock_repo):
+    """Replace the git repository wrapper class with a mock.
+
+    Patches the attribute directly on the module rather than resolving a
+    dotted string path on every test.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        mock_repo: Repository mock returned when the class is instantiated.
+
+    Returns:
+        MagicMock standing in for the git repository wrapper class.
+    """
+    repo_class = unittest.mock.MagicMock(return_value=mock_repo)
+    monkeypatch.setattr(git_repository, "Repository", repo_class)
+    return repo_class
@@ -17,7 +17,7 @@ class TestRepository:
     def __init__(self, path: pathlib.Path):
         """Initialize test repository."""
         self.path = path
-        self.repo = pygit2.init_repository(str(path))
+        self.repo = pygit2.init_repository(str(path), initial_head="main")
         self.commits: dict[str, str] = {}  # name -> sha mapping
         self._setup_signature()
 
@@ -42,7 +42,7 @@ class TestRepository:
         """Create a commit and optionally store it by name."""
         tree = self.repo.index.write_tree()
         parents = []
-        if not self.repo.is_empty:
+        if not self.repo.head_is_unborn:
             parents = [self.repo.head.target]
 
         commit_sha = self.repo.create_commit(
@@ -98,10 +98,9 @@ def minimal_repo(temp_git_dir: pathlib.Path) -> TestRepository:
     return repo
 
 
-@pytest.fixture
-def multi_branch_repo(temp_git_dir: pathlib.Path) -> TestRepository:
-    """Create a repository with multiple branches and commits."""
-    repo = TestRepository(temp_git_dir / "multi_branch")
+def build_multi_branch_repo(path: pathlib.Path) -> TestRepository:
+    """Build a repository with multiple branches and commits at path."""
+    repo = TestRepository(path)
 
     # Initial commit on main
     repo.add_file("README.md", "# Multi-Branch Test Repository\n")
@@ -137,6 +136,23 @@ def multi_branch_repo(temp_git_dir: pathlib.Path) -> TestRepository:
     return repo
 
 
+@pytest.fixture
+def multi_branch_repo(temp_git_dir: pathlib.Path) -> TestRepository:
+    """Create a repository with multiple branches and commits."""
+    return build_multi_branch_repo(temp_git_dir / "multi_branch")
+
+
+@pytest.fixture(scope="session")
+def shared_multi_branch_repo(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> TestRepository:
+    """Provide one multi-branch repository for the whole session.
+
+    Built once and shared, so tests must only read from it.
+    """
+    return build_multi_branch_repo(tmp_path_factory.mktemp("shared") / "multi_branch")
+
+
 @pytest.fixture
 def tagged_repo(temp_git_dir: pathlib.Path) -> TestRepository:
     """Create a repository with tags."""
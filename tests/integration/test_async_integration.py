@@ -33,34 +33,24 @@ async def test_async_config_manager():
 
 
 @pytest.mark.asyncio
-async def test_async_database_manager():
+async def test_async_database_manager(tmp_path):
     """Test AsyncDatabaseManager functionality."""
-    import pathlib
-    import tempfile
+    db_path = tmp_path / "test.db"
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = pathlib.Path(tmp.name)
+    manager = SQLModelDatabaseManager(db_path)
+    await manager.initialize()
 
-    try:
-        manager = SQLModelDatabaseManager(db_path)
-        await manager.initialize()
+    # Test adding a repository
+    repo_id = await manager.add_repository("/test/path", "test-repo")
+    assert isinstance(repo_id, int)
 
-        # Test adding a repository
-        repo_id = await manager.add_repository("/test/path", "test-repo")
-        assert isinstance(repo_id, int)
+    # Test getting repository by path
+    repo = await manager.get_repository("/test/path")
+    assert repo is not None
+    assert repo.name == "test-repo"
 
-        # Test getting repository by path
-        repo = await manager.get_repository("/test/path")
-        assert repo is not None
-        assert repo.name == "test-repo"
+    # Test getting stats
+    stats = await manager.get_stats()
+    assert isinstance(stats, dict)
 
-        # Test getting stats
-        stats = await manager.get_stats()
-        assert isinstance(stats, dict)
-
-        await manager.close()
-
-    finally:
-        # Clean up
-        if db_path.exists():
-            db_path.unlink()
+    await manager.close()
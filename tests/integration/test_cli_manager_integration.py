@@ -26,7 +26,7 @@ class TestCLIManagerIntegration:
         """Provide a mock manager factory."""
         # Create test database
         db_path = tmp_path / "test.db"
-        asyncio.run(alembic.create_test_database(db_path))
+        alembic.copy_test_database(db_path)
 
         # Patch the factory function to use test database
         original_get_manager_factory = manager_factory.get_manager_factory
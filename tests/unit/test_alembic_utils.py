@@ -1,6 +1,8 @@
 """Unit tests for alembic testing utilities."""
 
+import contextlib
 import pathlib
+import sqlite3
 import tempfile
 from unittest import mock
 
@@ -141,6 +143,41 @@ class TestDatabaseCreation:
             # Cleanup
             result_path.unlink()
 
+    def test_copy_test_database_writes_template_bytes(self, tmp_path):
+        """Test each copy writes the template bytes, creating parent directories."""
+        with mock.patch(
+            "tests.fixtures.alembic.migrated_database_bytes",
+            return_value=b"template",
+        ) as mock_template:
+            first = alembic.copy_test_database(tmp_path / "first" / "test.db")
+            second = alembic.copy_test_database(tmp_path / "second.db")
+
+        assert first.read_bytes() == b"template"
+        assert second.read_bytes() == b"template"
+        assert mock_template.call_count == 2  # caching lives in the helper itself
+
+    def test_migrated_database_bytes_is_cached(self):
+        """Test the migrated template is only built once."""
+        assert alembic.migrated_database_bytes() is alembic.migrated_database_bytes()
+
+    def test_copy_test_database_is_stamped_at_head(self, tmp_path):
+        """Test the template schema is stamped with the alembic head revision."""
+        db_path = alembic.copy_test_database(tmp_path / "test.db")
+
+        with contextlib.closing(sqlite3.connect(db_path)) as connection:
+            revisions = connection.execute(
+                "SELECT version_num FROM alembic_version"
+            ).fetchall()
+            tables = {
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+
+        assert len(revisions) == 1
+        assert {"repositories", "commits", "branches"} <= tables
+
     @pytest.mark.asyncio
     async def test_reset_test_database(self):
         """Test resetting test database."""
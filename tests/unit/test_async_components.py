@@ -3,6 +3,7 @@
 import asyncio
 import pathlib
 import tempfile
+import threading
 from unittest import mock
 
 import httpx
@@ -14,7 +15,9 @@ from ca_bhfuil.core import async_errors
 from ca_bhfuil.core import async_monitor
 from ca_bhfuil.core import async_progress
 from ca_bhfuil.core import async_repository
+from ca_bhfuil.core import async_sync
 from ca_bhfuil.core import async_tasks
+from ca_bhfuil.core.managers import factory
 from ca_bhfuil.core.models import progress
 from ca_bhfuil.integrations import async_http
 from ca_bhfuil.storage import sqlmodel_manager
@@ -45,6 +48,65 @@ class TestAsyncConfigManager:
         assert config is not None
         assert hasattr(config, "repos")
 
+    async def test_load_configuration_parses_off_event_loop(self, temp_config_dir):
+        """Test configuration files are parsed in a worker thread."""
+        manager = async_config.AsyncConfigManager(temp_config_dir)
+        manager.repositories_file.write_text(
+            "repos:\n"
+            "  - name: repo\n"
+            "    source:\n"
+            "      url: https://github.com/user/repo.git\n"
+        )
+        parse_threads = []
+        parse_config_text = async_config.config.parse_config_text
+
+        def recording_parse(text):
+            parse_threads.append(threading.get_ident())
+            return parse_config_text(text)
+
+        with mock.patch.object(
+            async_config.config, "parse_config_text", side_effect=recording_parse
+        ):
+            global_config = await manager.load_configuration()
+
+        assert [repo.name for repo in global_config.repos] == ["repo"]
+        assert parse_threads
+        assert threading.get_ident() not in parse_threads
+
+    async def test_get_repository_config_by_name_uses_index(self, temp_config_dir):
+        """Test name lookups only reload repos.yaml after it changes."""
+        manager = async_config.AsyncConfigManager(temp_config_dir)
+        manager.repositories_file.write_text(
+            "repos:\n"
+            "  - name: repo\n"
+            "    source:\n"
+            "      url: https://github.com/user/repo.git\n"
+        )
+        reads = []
+        read_config = manager._read_config
+
+        async def counting_read(path):
+            reads.append(path)
+            return await read_config(path)
+
+        with mock.patch.object(manager, "_read_config", side_effect=counting_read):
+            first = await manager.get_repository_config_by_name("repo")
+            second = await manager.get_repository_config_by_name("repo")
+            assert first is second
+            assert await manager.get_repository_config_by_name("missing") is None
+            assert len(reads) == 1
+
+            manager.repositories_file.write_text(
+                "repos:\n"
+                "  - name: renamed\n"
+                "    source:\n"
+                "      url: https://github.com/user/repo.git\n"
+            )
+            assert await manager.get_repository_config_by_name("repo") is None
+            renamed = await manager.get_repository_config_by_name("renamed")
+            assert renamed is not None
+            assert len(reads) == 2
+
     async def test_get_repository_config_none(self, temp_config_dir):
         """Test getting repository config when none exists."""
         manager = async_config.AsyncConfigManager(temp_config_dir)
@@ -473,10 +535,9 @@ class TestAsyncDatabaseManager:
     """Test AsyncDatabaseManager functionality."""
 
     @pytest.fixture
-    def temp_db_path(self):
+    def temp_db_path(self, tmp_path):
         """Provide temporary database path."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            yield pathlib.Path(tmp.name)
+        return tmp_path / "test.db"
 
     async def test_connection_and_execution(self, temp_db_path):
         """Test database initialization and operations."""
@@ -580,6 +641,29 @@ class TestAsyncCLIBridge:
             await async_bridge.with_progress(failing_operation(), "Failing operation")
 
 
+class TestRunAsync:
+    """Test the CLI async entry point."""
+
+    @pytest.mark.parametrize("fails", [False, True])
+    def test_run_async_releases_globals(self, fails):
+        """Test run_async shuts down global resources when the command ends."""
+
+        async def command():
+            synchronizer = await async_sync.get_async_repository_synchronizer()
+            if fails:
+                raise ValueError("Command failed")
+            return synchronizer
+
+        if fails:
+            with pytest.raises(ValueError, match="Command failed"):
+                async_bridge.run_async(command())
+        else:
+            assert async_bridge.run_async(command()) is not None
+
+        assert async_sync._async_synchronizer is None
+        assert factory._global_factory is None
+
+
 class TestCommitModel:
     """Test CommitInfo model functionality."""
 
@@ -1,26 +1,52 @@
 """Tests for async repository registry functionality."""
 
-import pathlib
-import tempfile
-from unittest import mock
-
 import pytest
+import sqlmodel
 
 from ca_bhfuil.core import async_config
 from ca_bhfuil.core import async_registry
 from ca_bhfuil.core import config
 from ca_bhfuil.core.models import commit as commit_models
 from ca_bhfuil.storage import sqlmodel_manager
+from ca_bhfuil.storage.database import engine
+from tests.fixtures import alembic
+
+
+def _returning(value):
+    """Build an async stand-in method that always returns value."""
+
+    async def stub(*_args, **_kwargs):
+        return value
+
+    return stub
+
+
+class _StubStateRegistry(async_registry.AsyncRepositoryRegistry):
+    """Registry that reports a fixed repository state."""
+
+    stub_state: dict | None = None
+
+    async def get_repository_state(self, repo_name):
+        return self.stub_state
+
+
+@pytest.fixture(scope="module")
+async def shared_db_manager(tmp_path_factory):
+    """Provide one database manager for the module on a migrated database."""
+    db_path = tmp_path_factory.mktemp("registry") / "registry.db"
+    database_engine = engine.DatabaseEngine(alembic.copy_test_database(db_path))
+    yield sqlmodel_manager.SQLModelDatabaseManager(database_engine=database_engine)
+    await database_engine.close()
 
 
 @pytest.fixture
-async def db_manager():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = pathlib.Path(temp_dir) / "test.db"
-        manager = sqlmodel_manager.SQLModelDatabaseManager(db_path)
-        await manager.initialize()
-        yield manager
-        await manager.close()
+async def db_manager(shared_db_manager):
+    """Provide the shared database manager with every table emptied."""
+    async with shared_db_manager.engine.get_session() as session:
+        for table in reversed(sqlmodel.SQLModel.metadata.sorted_tables):
+            await session.execute(table.delete())
+        await session.commit()
+    return shared_db_manager
 
 
 @pytest.fixture
@@ -33,17 +59,56 @@ def repository_registry(config_manager, db_manager):
     return async_registry.AsyncRepositoryRegistry(config_manager, db_manager)
 
 
+@pytest.fixture(scope="module")
+def sample_repo_config():
+    """Provide a sample repository configuration shared by the module."""
+    return config.RepositoryConfig(
+        name="test-repo",
+        source={"url": "https://github.com/test/repo.git", "type": "git"},
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_commit_info():
+    """Provide a sample commit shared by the module."""
+    return commit_models.CommitInfo(
+        sha="abc123def456",
+        short_sha="abc123d",
+        message="Fix memory leak",
+        author_name="Test Author",
+        author_email="test@example.com",
+        author_date="2024-01-01T12:00:00+00:00",
+        committer_name="Test Author",
+        committer_email="test@example.com",
+        committer_date="2024-01-01T12:00:00+00:00",
+        parents=["def456ghi789"],
+    )
+
+
+@pytest.fixture
+def configured_manager(config_manager, sample_repo_config, monkeypatch):
+    """Provide the config manager stubbed to serve the sample repository."""
+    global_config = config.GlobalConfig(repos=[sample_repo_config])
+
+    async def get_repository_config_by_name(name):
+        return sample_repo_config if name == sample_repo_config.name else None
+
+    monkeypatch.setattr(config_manager, "load_configuration", _returning(global_config))
+    monkeypatch.setattr(
+        config_manager, "get_repository_config_by_name", get_repository_config_by_name
+    )
+    return config_manager
+
+
+@pytest.fixture
+async def registered_repo(repository_registry, configured_manager, sample_repo_config):
+    """Register the sample repository and provide its database ID."""
+    return await repository_registry.register_repository(sample_repo_config)
+
+
 class TestAsyncRepositoryRegistry:
     """Test async repository registry operations."""
 
-    @pytest.fixture
-    def sample_repo_config(self, tmp_path):
-        """Provide a sample repository configuration."""
-        return config.RepositoryConfig(
-            name="test-repo",
-            source={"url": "https://github.com/test/repo.git", "type": "git"},
-        )
-
     @pytest.mark.asyncio
     async def test_repository_registry_initialization(self, repository_registry):
         """Test async repository registry initializes correctly."""
@@ -52,22 +117,18 @@ class TestAsyncRepositoryRegistry:
         assert repository_registry._lock is not None
 
     @pytest.mark.asyncio
-    async def test_register_repository(self, repository_registry, sample_repo_config):
+    async def test_register_repository(
+        self, repository_registry, configured_manager, sample_repo_config
+    ):
         """Test async repository registration."""
-        # Mock the config manager to return the sample config
-        with mock.patch.object(
-            repository_registry.config_manager,
-            "get_repository_config_by_name",
-            return_value=sample_repo_config,
-        ):
-            repo_id = await repository_registry.register_repository(sample_repo_config)
-            assert isinstance(repo_id, int)
-            assert repo_id > 0
+        repo_id = await repository_registry.register_repository(sample_repo_config)
+        assert isinstance(repo_id, int)
+        assert repo_id > 0
 
-            # Verify it was stored
-            repo_state = await repository_registry.get_repository_state("test-repo")
-            assert repo_state is not None
-            assert repo_state["config"]["name"] == "test-repo"
+        # Verify it was stored
+        repo_state = await repository_registry.get_repository_state("test-repo")
+        assert repo_state is not None
+        assert repo_state["config"]["name"] == "test-repo"
 
     @pytest.mark.asyncio
     async def test_get_repository_state_not_found(self, repository_registry):
@@ -77,68 +138,37 @@ class TestAsyncRepositoryRegistry:
 
     @pytest.mark.asyncio
     async def test_get_repository_state_configured_only(
-        self, repository_registry, sample_repo_config
+        self, repository_registry, configured_manager, monkeypatch
     ):
         """Test getting state for repository that's configured but not registered."""
-        with (
-            mock.patch.object(
-                repository_registry.config_manager,
-                "get_repository_config_by_name",
-                return_value=sample_repo_config,
-            ),
-            mock.patch.object(
-                repository_registry.db_manager, "get_repository", return_value=None
-            ),
-        ):
-            state = await repository_registry.get_repository_state("test-repo")
+        monkeypatch.setattr(
+            repository_registry.db_manager, "get_repository", _returning(None)
+        )
+        state = await repository_registry.get_repository_state("test-repo")
 
         assert state is not None
         assert state["config"]["name"] == "test-repo"
         assert state["registered"] is False
 
     @pytest.mark.asyncio
-    async def test_list_repositories(self, repository_registry, sample_repo_config):
+    async def test_list_repositories(self, repository_registry, registered_repo):
         """Test listing all repositories."""
-        # Register a repository
-        await repository_registry.register_repository(sample_repo_config)
-
-        # Mock configuration loading
-        global_config = config.GlobalConfig(repos=[sample_repo_config])
-        with mock.patch.object(
-            repository_registry.config_manager,
-            "load_configuration",
-            return_value=mock.AsyncMock(return_value=global_config),
-        ) as mock_load:
-            mock_load.return_value = global_config
-            repositories = await repository_registry.list_repositories()
+        repositories = await repository_registry.list_repositories()
 
         assert len(repositories) == 1
         assert repositories[0]["config"]["name"] == "test-repo"
 
     @pytest.mark.asyncio
-    async def test_update_repository_stats(
-        self, repository_registry, sample_repo_config
-    ):
+    async def test_update_repository_stats(self, repository_registry, registered_repo):
         """Test updating repository statistics."""
-        # Mock config manager to return repo config
-        with mock.patch.object(
-            repository_registry.config_manager,
-            "get_repository_config_by_name",
-            return_value=sample_repo_config,
-        ):
-            # Register repository first
-            await repository_registry.register_repository(sample_repo_config)
-
-            # Update stats
-            success = await repository_registry.update_repository_stats(
-                "test-repo", 100, 5
-            )
-            assert success is True
-
-            # Verify stats were updated
-            state = await repository_registry.get_repository_state("test-repo")
-            assert state["commit_count"] == 100
-            assert state["branch_count"] == 5
+        # Update stats
+        success = await repository_registry.update_repository_stats("test-repo", 100, 5)
+        assert success is True
+
+        # Verify stats were updated
+        state = await repository_registry.get_repository_state("test-repo")
+        assert state["commit_count"] == 100
+        assert state["branch_count"] == 5
 
     @pytest.mark.asyncio
     async def test_update_repository_stats_not_found(self, repository_registry):
@@ -148,143 +178,89 @@ class TestAsyncRepositoryRegistry:
         )
         assert success is False
 
+    @pytest.mark.asyncio
+    async def test_update_repository_stats_bulk(
+        self, repository_registry, registered_repo
+    ):
+        """Test updating statistics for several repositories at once."""
+        registered = await repository_registry.registered_repository_names(
+            ["test-repo", "nonexistent"]
+        )
+        assert registered == {"test-repo"}
+
+        updated = await repository_registry.update_repository_stats_bulk(
+            [("test-repo", 100, 5), ("nonexistent", 1, 1)]
+        )
+        assert updated == {"test-repo": True, "nonexistent": False}
+
+        state = await repository_registry.get_repository_state("test-repo")
+        assert state["commit_count"] == 100
+        assert state["branch_count"] == 5
+        assert state["last_analyzed"] is not None
+
     @pytest.mark.asyncio
     async def test_update_repository_stats_auto_registration(
-        self, repository_registry, sample_repo_config, tmp_path
+        self, repository_registry, sample_repo_config, tmp_path, monkeypatch
     ):
         """Test auto-registration of repository during stats update."""
-        # Create a fake git repository directory
-        repo_path = tmp_path / "test-repo"
-        repo_path.mkdir()
-        git_dir = repo_path / ".git"
-        git_dir.mkdir()
+        # Point the config's repo_path at our cache directory
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
-        # Update the sample config to point to our test path
-        sample_repo_config.source["path"] = str(repo_path)
+        # Create a fake git repository directory where the config expects it
+        (sample_repo_config.repo_path / ".git").mkdir(parents=True)
 
-        # Mock config manager to return repo config
-        with mock.patch.object(
+        # Stub config manager to return repo config
+        monkeypatch.setattr(
             repository_registry.config_manager,
             "get_repository_config_by_name",
-            return_value=sample_repo_config,
-        ):
-            # Don't register repository first - let update_repository_stats auto-register it
-            success = await repository_registry.update_repository_stats(
-                "test-repo", 100, 5
-            )
-            assert success is True
-
-            # Verify repository was auto-registered and stats were updated
-            state = await repository_registry.get_repository_state("test-repo")
-            assert state["registered"] is True
-            assert state["commit_count"] == 100
-            assert state["branch_count"] == 5
+            _returning(sample_repo_config),
+        )
+        # Don't register repository first - let update_repository_stats auto-register it
+        success = await repository_registry.update_repository_stats("test-repo", 100, 5)
+        assert success is True
+
+        # Verify repository was auto-registered and stats were updated
+        state = await repository_registry.get_repository_state("test-repo")
+        assert state["registered"] is True
+        assert state["commit_count"] == 100
+        assert state["branch_count"] == 5
 
     @pytest.mark.asyncio
-    async def test_add_commit(self, repository_registry, sample_repo_config):
+    async def test_add_commit(
+        self, repository_registry, registered_repo, sample_commit_info
+    ):
         """Test adding a commit to the repository."""
-        # Mock config manager to return repo config
-        with mock.patch.object(
-            repository_registry.config_manager,
-            "get_repository_config_by_name",
-            return_value=sample_repo_config,
-        ):
-            # Register repository first
-            await repository_registry.register_repository(sample_repo_config)
-
-            # Create sample commit
-            commit_info = commit_models.CommitInfo(
-                sha="abc123def456",
-                short_sha="abc123d",
-                message="Test commit",
-                author_name="Test Author",
-                author_email="test@example.com",
-                author_date="2024-01-01T12:00:00+00:00",
-                committer_name="Test Author",
-                committer_email="test@example.com",
-                committer_date="2024-01-01T12:00:00+00:00",
-                parents=["def456ghi789"],
-            )
-
-            # Add commit
-            success = await repository_registry.add_commit("test-repo", commit_info)
-            assert success is True
+        # Add commit
+        success = await repository_registry.add_commit("test-repo", sample_commit_info)
+        assert success is True
 
     @pytest.mark.asyncio
     async def test_add_commit_auto_register(
-        self, repository_registry, sample_repo_config
+        self, repository_registry, configured_manager, sample_commit_info
     ):
         """Test adding a commit auto-registers repository."""
-        # Mock configuration to return the repo config
-        with mock.patch.object(
-            repository_registry.config_manager,
-            "get_repository_config_by_name",
-            return_value=mock.AsyncMock(return_value=sample_repo_config),
-        ) as mock_get_config:
-            mock_get_config.return_value = sample_repo_config
-
-            commit_info = commit_models.CommitInfo(
-                sha="abc123def456",
-                short_sha="abc123d",
-                message="Test commit",
-                author_name="Test Author",
-                author_email="test@example.com",
-                author_date="2024-01-01T12:00:00+00:00",
-                committer_name="Test Author",
-                committer_email="test@example.com",
-                committer_date="2024-01-01T12:00:00+00:00",
-                parents=["def456ghi789"],
-            )
-
-            # Add commit should auto-register
-            success = await repository_registry.add_commit("test-repo", commit_info)
-            assert success is True
+        # Add commit should auto-register
+        success = await repository_registry.add_commit("test-repo", sample_commit_info)
+        assert success is True
 
     @pytest.mark.asyncio
-    async def test_search_commits(self, repository_registry, sample_repo_config):
+    async def test_search_commits(
+        self, repository_registry, registered_repo, sample_commit_info
+    ):
         """Test searching commits in repository."""
-        commit_info = commit_models.CommitInfo(
-            sha="abc123def456",
-            short_sha="abc123d",
-            message="Fix memory leak",
-            author_name="Test Author",
-            author_email="test@example.com",
-            author_date="2024-01-01T12:00:00+00:00",
-            committer_name="Test Author",
-            committer_email="test@example.com",
-            committer_date="2024-01-01T12:00:00+00:00",
-            parents=["def456ghi789"],
+        await repository_registry.add_commit("test-repo", sample_commit_info)
+
+        # Search by SHA
+        commits = await repository_registry.search_commits(
+            "test-repo", sha_pattern="abc123"
+        )
+        assert [commit.sha for commit in commits] == ["abc123def456"]
+
+        # Search by message
+        commits = await repository_registry.search_commits(
+            "test-repo", message_pattern="memory"
         )
-        mock_repo = mock.Mock(spec=sqlmodel_manager.models.RepositoryRead)
-        mock_repo.id = 1
-        with (
-            mock.patch.object(
-                repository_registry.config_manager,
-                "get_repository_config_by_name",
-                return_value=sample_repo_config,
-            ),
-            mock.patch.object(
-                repository_registry.db_manager, "get_repository", return_value=mock_repo
-            ),
-            mock.patch.object(
-                repository_registry.db_manager,
-                "find_commits",
-                return_value=[commit_info],
-            ),
-        ):
-            # Search by SHA
-            commits = await repository_registry.search_commits(
-                "test-repo", sha_pattern="abc123"
-            )
-            assert len(commits) == 1
-            assert commits[0].sha == "abc123def456"
-
-            # Search by message
-            commits = await repository_registry.search_commits(
-                "test-repo", message_pattern="memory"
-            )
-            assert len(commits) == 1
-            assert "memory" in commits[0].message
+        assert [commit.sha for commit in commits] == ["abc123def456"]
 
     @pytest.mark.asyncio
     async def test_search_commits_not_found(self, repository_registry):
@@ -295,25 +271,16 @@ class TestAsyncRepositoryRegistry:
         assert len(commits) == 0
 
     @pytest.mark.asyncio
-    async def test_get_registry_stats(self, repository_registry, sample_repo_config):
+    async def test_get_registry_stats(
+        self, repository_registry, configured_manager, monkeypatch
+    ):
         """Test getting registry statistics."""
-        with (
-            mock.patch.object(
-                repository_registry.config_manager,
-                "load_configuration",
-                return_value=config.GlobalConfig(repos=[sample_repo_config]),
-            ),
-            mock.patch.object(
-                repository_registry.db_manager,
-                "get_stats",
-                return_value={
-                    "repositories": 1,
-                    "commits": 0,
-                    "branches": 0,
-                },
-            ),
-        ):
-            stats = await repository_registry.get_registry_stats()
+        monkeypatch.setattr(
+            repository_registry.db_manager,
+            "get_stats",
+            _returning({"repositories": 1, "commits": 0, "branches": 0}),
+        )
+        stats = await repository_registry.get_registry_stats()
 
         assert stats["configured_repositories"] == 1
         assert stats["registered_repositories"] == 1
@@ -327,7 +294,7 @@ class TestAsyncRepositoryRegistry:
         assert "not found" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_sync_repository_state(self, repository_registry):
+    async def test_sync_repository_state(self, config_manager, db_manager):
         """Test syncing repository state."""
         # Mock the repository state
         mock_state = {
@@ -341,13 +308,9 @@ class TestAsyncRepositoryRegistry:
             "registered": True,
         }
 
-        with mock.patch.object(
-            repository_registry,
-            "get_repository_state",
-            return_value=mock.AsyncMock(return_value=mock_state),
-        ) as mock_get_state:
-            mock_get_state.return_value = mock_state
-            result = await repository_registry.sync_repository_state("test-repo")
+        registry = _StubStateRegistry(config_manager, db_manager)
+        registry.stub_state = mock_state
+        result = await registry.sync_repository_state("test-repo")
 
         assert result["success"] is True
         assert result["repository"] == "test-repo"
@@ -1,7 +1,10 @@
 """Tests for async repository synchronization functionality."""
 
-import pathlib
-import tempfile
+import asyncio
+import concurrent.futures
+import operator
+import os
+import types
 from unittest import mock
 
 import pytest
@@ -12,31 +15,54 @@ from ca_bhfuil.core import async_sync
 from ca_bhfuil.core import config
 from ca_bhfuil.core.git import async_git
 from ca_bhfuil.core.models import results as results_models
+from tests.fixtures import repositories
+
+
+def _reset(spec_mock):
+    """Clear the calls, return values and side effects left by a previous test."""
+    spec_mock.reset_mock(return_value=True, side_effect=True)
+    return spec_mock
 
 
 class TestAsyncRepositorySynchronizer:
     """Test AsyncRepositorySynchronizer functionality."""
 
     @pytest.fixture
-    def temp_repo_path(self):
+    def temp_repo_path(self, tmp_path):
         """Provide a temporary repository path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield pathlib.Path(temp_dir)
+        return tmp_path
+
+    @pytest.fixture(scope="class")
+    def config_manager_spec(self):
+        """Provide an autospecced configuration manager built once per class."""
+        return mock.create_autospec(async_config.AsyncConfigManager, instance=True)
+
+    @pytest.fixture(scope="class")
+    def repo_registry_spec(self):
+        """Provide an autospecced repository registry built once per class."""
+        return mock.create_autospec(
+            async_registry.AsyncRepositoryRegistry, instance=True
+        )
+
+    @pytest.fixture(scope="class")
+    def git_manager_spec(self):
+        """Provide an autospecced git manager built once per class."""
+        return mock.create_autospec(async_git.AsyncGitManager, instance=True)
 
     @pytest.fixture
-    def mock_config_manager(self):
+    def mock_config_manager(self, config_manager_spec):
         """Provide a mock async configuration manager."""
-        return mock.AsyncMock(spec=async_config.AsyncConfigManager)
+        return _reset(config_manager_spec)
 
     @pytest.fixture
-    def mock_repo_registry(self):
+    def mock_repo_registry(self, repo_registry_spec):
         """Provide a mock async repository registry."""
-        return mock.AsyncMock(spec=async_registry.AsyncRepositoryRegistry)
+        return _reset(repo_registry_spec)
 
     @pytest.fixture
-    def mock_git_manager(self):
+    def mock_git_manager(self, git_manager_spec):
         """Provide a mock async git manager."""
-        return mock.AsyncMock(spec=async_git.AsyncGitManager)
+        return _reset(git_manager_spec)
 
     @pytest.fixture
     def async_synchronizer(
@@ -48,18 +74,38 @@ class TestAsyncRepositorySynchronizer:
         )
 
     @pytest.fixture
-    def sample_repo_config(self, temp_repo_path):
+    def repo_path_mock(self, temp_repo_path, monkeypatch):
+        """Point every repository configuration at the temporary path."""
+        mock_path = mock.PropertyMock(return_value=temp_repo_path)
+        monkeypatch.setattr(config.RepositoryConfig, "repo_path", mock_path)
+        return mock_path
+
+    @pytest.fixture
+    def sample_repo_config(self, repo_path_mock):
         """Provide a sample repository configuration."""
-        repo_config = config.RepositoryConfig(
+        return config.RepositoryConfig(
             name="test-repo",
             source={"url": "https://github.com/test/repo.git", "type": "git"},
         )
-        # Mock the repo_path property
-        with mock.patch.object(
-            type(repo_config), "repo_path", new_callable=mock.PropertyMock
-        ) as mock_path:
-            mock_path.return_value = temp_repo_path
-            yield repo_config
+
+    @pytest.fixture
+    def configured_git_repo(
+        self, async_synchronizer, sample_repo_config, temp_repo_path
+    ):
+        """Provide the sample repository as a configured git checkout."""
+        (temp_repo_path / ".git").mkdir()
+        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
+            sample_repo_config
+        )
+        return sample_repo_config
+
+    @pytest.fixture
+    def shared_repo_config(
+        self, sample_repo_config, repo_path_mock, shared_multi_branch_repo
+    ):
+        """Provide a configuration pointing at the shared real repository."""
+        repo_path_mock.return_value = shared_multi_branch_repo.path
+        return sample_repo_config
 
     def test_async_synchronizer_initialization(
         self,
@@ -74,145 +120,97 @@ class TestAsyncRepositorySynchronizer:
         assert async_synchronizer.git_manager == mock_git_manager
         assert async_synchronizer._sync_semaphore._value == 3
 
-    def test_async_synchronizer_default_initialization(self):
+    def test_async_synchronizer_default_initialization(self, monkeypatch):
         """Test async synchronizer initialization with defaults."""
-        with (
-            mock.patch(
-                "ca_bhfuil.core.async_config.AsyncConfigManager"
-            ) as mock_config_class,
-            mock.patch(
-                "ca_bhfuil.core.async_registry.AsyncRepositoryRegistry"
-            ) as mock_registry_class,
-            mock.patch(
-                "ca_bhfuil.core.git.async_git.AsyncGitManager"
-            ) as mock_git_class,
-        ):
-            mock_config = mock.AsyncMock()
-            mock_registry = mock.AsyncMock()
-            mock_git = mock.AsyncMock()
-            mock_config_class.return_value = mock_config
-            mock_registry_class.return_value = mock_registry
-            mock_git_class.return_value = mock_git
-
-            synchronizer = async_sync.AsyncRepositorySynchronizer()
-
-            assert synchronizer.config_manager == mock_config
-            assert synchronizer.repo_registry == mock_registry
-            assert synchronizer.git_manager == mock_git
+        mock_config = mock.AsyncMock()
+        mock_registry = mock.AsyncMock()
+        mock_git = mock.AsyncMock()
+        monkeypatch.setattr(
+            async_config, "AsyncConfigManager", mock.Mock(return_value=mock_config)
+        )
+        monkeypatch.setattr(
+            async_registry,
+            "AsyncRepositoryRegistry",
+            mock.Mock(return_value=mock_registry),
+        )
+        monkeypatch.setattr(
+            async_git, "AsyncGitManager", mock.Mock(return_value=mock_git)
+        )
+
+        synchronizer = async_sync.AsyncRepositorySynchronizer()
+
+        assert synchronizer.config_manager == mock_config
+        assert synchronizer.repo_registry == mock_registry
+        assert synchronizer.git_manager == mock_git
 
     @pytest.mark.asyncio
     async def test_sync_repository_success(
-        self, async_synchronizer, sample_repo_config, temp_repo_path
+        self, async_synchronizer, configured_git_repo, monkeypatch
     ):
         """Test successful async repository synchronization."""
-        # Mock git directory exists
-        git_dir = temp_repo_path / ".git"
-        git_dir.mkdir()
-
-        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
-            sample_repo_config
-        )
-
-        # Mock the sync operation
         sync_result = {
             "success": True,
             "repository": "test-repo",
             "new_refs": 2,
             "new_commits": 5,
         }
+        async_synchronizer.git_manager.run_in_executor.return_value = sync_result
+        mock_update = mock.AsyncMock()
+        monkeypatch.setattr(
+            async_synchronizer, "_update_registry_after_sync", mock_update
+        )
 
-        with (
-            mock.patch.object(
-                async_synchronizer.git_manager,
-                "run_in_executor",
-                return_value=sync_result,
-            ),
-            mock.patch.object(
-                async_synchronizer, "_update_registry_after_sync"
-            ) as mock_update,
-        ):
-            result = await async_synchronizer.sync_repository("test-repo")
+        result = await async_synchronizer.sync_repository("test-repo")
 
-            assert result.success is True
-            assert result.result == sync_result
-            mock_update.assert_called_once_with(sample_repo_config, sync_result)
+        assert result.success is True
+        assert result.result == sync_result
+        mock_update.assert_called_once_with(configured_git_repo, sync_result)
 
     @pytest.mark.asyncio
     async def test_sync_repository_auto_healing(
-        self, async_synchronizer, sample_repo_config, temp_repo_path
+        self, async_synchronizer, configured_git_repo, monkeypatch
     ):
         """Test sync repository auto-registers missing repositories through update_repository_stats."""
-        # Mock git directory exists
-        git_dir = temp_repo_path / ".git"
-        git_dir.mkdir()
-
-        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
-            sample_repo_config
-        )
-
-        # Mock the sync operation
         sync_result = {
             "success": True,
             "repository": "test-repo",
             "commits_after": 10,
         }
-
-        # Mock _update_registry_after_sync to verify it gets called
-        with (
-            mock.patch.object(
-                async_synchronizer.git_manager,
-                "run_in_executor",
-                return_value=sync_result,
-            ),
-            mock.patch.object(
-                async_synchronizer,
-                "_update_registry_after_sync",
-            ) as mock_update_registry,
-        ):
-            result = await async_synchronizer.sync_repository("test-repo")
-
-            assert result.success is True
-            assert result.result == sync_result
-            # Verify that _update_registry_after_sync was called - this method calls
-            # update_repository_stats which handles auto-registration
-            mock_update_registry.assert_called_once_with(
-                sample_repo_config, sync_result
-            )
-
-    @pytest.mark.asyncio
-    async def test_sync_repository_not_found_in_config(self, async_synchronizer):
-        """Test async sync when repository not found in configuration."""
-        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
-            None
+        async_synchronizer.git_manager.run_in_executor.return_value = sync_result
+        mock_update_registry = mock.AsyncMock()
+        monkeypatch.setattr(
+            async_synchronizer, "_update_registry_after_sync", mock_update_registry
         )
 
-        result = await async_synchronizer.sync_repository("nonexistent")
+        result = await async_synchronizer.sync_repository("test-repo")
 
-        assert result.success is False
-        assert "not found in configuration" in result.error
+        assert result.success is True
+        assert result.result == sync_result
+        # Verify that _update_registry_after_sync was called - this method calls
+        # update_repository_stats which handles auto-registration
+        mock_update_registry.assert_called_once_with(configured_git_repo, sync_result)
 
     @pytest.mark.asyncio
     async def test_sync_repository_path_not_exists(
-        self, async_synchronizer, sample_repo_config
+        self, async_synchronizer, sample_repo_config, repo_path_mock, temp_repo_path
     ):
         """Test async sync when repository path doesn't exist."""
-        # Mock path doesn't exist by patching pathlib.Path.exists
-        with mock.patch("pathlib.Path.exists", return_value=False):
-            async_synchronizer.config_manager.get_repository_config_by_name.return_value = sample_repo_config
+        repo_path_mock.return_value = temp_repo_path / "missing"
+        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
+            sample_repo_config
+        )
 
-            result = await async_synchronizer.sync_repository("test-repo")
+        result = await async_synchronizer.sync_repository("test-repo")
 
-            assert result.success is False
-            assert "does not exist" in result.error
+        assert result.success is False
+        assert "does not exist" in result.error
 
     @pytest.mark.asyncio
     async def test_sync_repository_not_git_repo(
         self, async_synchronizer, sample_repo_config, temp_repo_path
     ):
         """Test async sync when path exists but is not a git repository."""
-        # Create directory but no .git subdirectory
-        temp_repo_path.mkdir(exist_ok=True)
-
+        # The directory exists but has no .git subdirectory
         async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
             sample_repo_config
         )
@@ -224,78 +222,231 @@ class TestAsyncRepositorySynchronizer:
 
     @pytest.mark.asyncio
     async def test_sync_repository_sync_failure(
-        self, async_synchronizer, sample_repo_config, temp_repo_path
+        self, async_synchronizer, configured_git_repo
     ):
         """Test async sync when sync operation fails."""
-        git_dir = temp_repo_path / ".git"
-        git_dir.mkdir()
-
-        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
-            sample_repo_config
-        )
-
         sync_result = {
             "success": False,
             "error": "Remote not found",
         }
+        async_synchronizer.git_manager.run_in_executor.return_value = sync_result
 
-        with mock.patch.object(
-            async_synchronizer.git_manager, "run_in_executor", return_value=sync_result
-        ):
-            result = await async_synchronizer.sync_repository("test-repo")
+        result = await async_synchronizer.sync_repository("test-repo")
 
-            assert result.success is False
-            assert result.result == sync_result
+        assert result.success is False
+        assert result.result == sync_result
 
     @pytest.mark.asyncio
-    async def test_sync_repository_exception(self, async_synchronizer):
-        """Test async sync with unexpected exception."""
-        async_synchronizer.config_manager.get_repository_config_by_name.side_effect = (
-            Exception("Unexpected error")
-        )
+    @pytest.mark.parametrize(
+        ("method", "lookup", "outcome", "expected_error"),
+        [
+            pytest.param(
+                "sync_repository",
+                "config_manager.get_repository_config_by_name",
+                Exception("Unexpected error"),
+                "Unexpected error",
+                id="sync-exception",
+            ),
+            pytest.param(
+                "sync_repository",
+                "config_manager.get_repository_config_by_name",
+                None,
+                "not found in configuration",
+                id="sync-not-configured",
+            ),
+            pytest.param(
+                "check_for_updates",
+                "config_manager.get_repository_config_by_name",
+                Exception("Update check error"),
+                "Update check error",
+                id="check-exception",
+            ),
+            pytest.param(
+                "check_for_updates",
+                "config_manager.get_repository_config_by_name",
+                None,
+                "configuration not found",
+                id="check-not-configured",
+            ),
+            pytest.param(
+                "get_sync_status",
+                "repo_registry.get_repository_state",
+                Exception("Status error"),
+                "Status error",
+                id="status-exception",
+            ),
+            pytest.param(
+                "get_sync_status",
+                "repo_registry.get_repository_state",
+                None,
+                "Repository not found",
+                id="status-not-registered",
+            ),
+        ],
+    )
+    async def test_repository_lookup_failures(
+        self, async_synchronizer, method, lookup, outcome, expected_error
+    ):
+        """Test each operation reports a failed or raising repository lookup."""
+        lookup_mock = operator.attrgetter(lookup)(async_synchronizer)
+        if isinstance(outcome, Exception):
+            lookup_mock.side_effect = outcome
+        else:
+            lookup_mock.return_value = outcome
 
-        result = await async_synchronizer.sync_repository("test-repo")
+        result = await getattr(async_synchronizer, method)("test-repo")
 
-        assert result.success is False
-        assert "Unexpected error" in result.error
+        if isinstance(result, results_models.OperationResult):
+            assert result.success is False
+            assert expected_error in result.error
+        else:
+            assert result["repository"] == "test-repo"
+            assert result["success"] is False
+            assert expected_error in result["error"]
 
     def test_perform_sync_sync_integration(
-        self, async_synchronizer, sample_repo_config
+        self, async_synchronizer, shared_repo_config
+    ):
+        """Test the executor sync step against a real repository."""
+        result = async_synchronizer._perform_sync_sync(shared_repo_config)
+
+        assert result["success"] is True
+        assert result["repository"] == "test-repo"
+        # main holds the initial commit plus file1 and file2
+        assert result["commits_before"] == 3
+        assert result["commits_after"] == 3
+        # main, feature and stable; the repository has no remotes
+        assert result["branch_count"] == 3
+
+    def test_repository_handle_reused(self, async_synchronizer, tmp_path, monkeypatch):
+        """Test the executor steps share one open repository until HEAD changes."""
+        import pygit2
+
+        repo_path = repositories.build_multi_branch_repo(tmp_path / "repo").path
+        repo_config = types.SimpleNamespace(name="test-repo", repo_path=repo_path)
+        open_repository = mock.Mock(wraps=pygit2.Repository)
+        monkeypatch.setattr(pygit2, "Repository", open_repository)
+
+        async_synchronizer._perform_sync_sync(repo_config)
+        async_synchronizer._perform_sync_sync(repo_config)
+        assert async_synchronizer._count_branches(repo_path) == 3
+        assert open_repository.call_count == 1
+
+        head_path = repo_path / ".git" / "HEAD"
+        head_stat = head_path.stat()
+        os.utime(
+            head_path, ns=(head_stat.st_atime_ns, head_stat.st_mtime_ns + 1_000_000_000)
+        )
+        async_synchronizer._perform_sync_sync(repo_config)
+        assert open_repository.call_count == 2
+
+    def test_perform_sync_sync_worktree(
+        self, async_synchronizer, sample_repo_config, repo_path_mock, tmp_path
+    ):
+        """Test a worktree, whose .git is a file, syncs and reuses its handle."""
+        main_repo = repositories.build_multi_branch_repo(tmp_path / "main")
+        worktree_path = tmp_path / "worktree"
+        main_repo.repo.add_worktree("worktree", str(worktree_path))
+        repo_path_mock.return_value = worktree_path
+        assert (worktree_path / ".git").is_file()
+
+        first = async_synchronizer._perform_sync_sync(sample_repo_config)
+        with async_synchronizer._repository(worktree_path) as handle:
+            pass
+
+        assert first["success"] is True
+        assert first["commits_after"] == 3
+        with async_synchronizer._repository(worktree_path) as repo:
+            assert repo is handle
+
+    def test_repository_handles_are_capped(
+        self, async_synchronizer, tmp_path, monkeypatch
+    ):
+        """Test only the most recently used repository handles are kept."""
+        monkeypatch.setattr(async_sync, "_MAX_REPO_HANDLES", 1)
+        first_path = repositories.build_multi_branch_repo(tmp_path / "first").path
+        second_path = repositories.build_multi_branch_repo(tmp_path / "second").path
+
+        async_synchronizer._count_branches(first_path)
+        async_synchronizer._count_branches(second_path)
+
+        assert list(async_synchronizer._repo_handles) == [second_path]
+
+    def test_perform_sync_sync_concurrent_repositories(
+        self, async_synchronizer, tmp_path
     ):
-        """Test the sync manager integration."""
-        # This tests the _perform_sync_sync method that delegates to sync manager
-        with mock.patch(
-            "ca_bhfuil.core.async_sync.AsyncRepositorySynchronizer._perform_sync_sync",
-            return_value={"success": True},
-        ):
-            result = async_synchronizer._perform_sync_sync(sample_repo_config)
-            assert result["success"] is True
+        """Test two repositories sync side by side from executor threads."""
+        repo_configs = [
+            types.SimpleNamespace(
+                name=name,
+                repo_path=repositories.build_multi_branch_repo(tmp_path / name).path,
+            )
+            for name in ("first", "second")
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(async_synchronizer._perform_sync_sync, repo_configs * 8)
+            )
+
+        assert all(result["success"] for result in results)
+        assert {result["repository"] for result in results} == {"first", "second"}
+        assert {result["commits_after"] for result in results} == {3}
+        assert set(async_synchronizer._repo_handles) == {
+            repo_config.repo_path for repo_config in repo_configs
+        }
+
+    def test_repository_handle_used_by_one_thread_at_a_time(
+        self, async_synchronizer, tmp_path
+    ):
+        """Test a thread waits while another is using the same repository."""
+        repo_path = repositories.build_multi_branch_repo(tmp_path / "repo").path
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            with async_synchronizer._repository(repo_path):
+                waiting = executor.submit(async_synchronizer._count_branches, repo_path)
+                with pytest.raises(concurrent.futures.TimeoutError):
+                    waiting.result(timeout=0.2)
+
+            assert waiting.result(timeout=5) == 3
 
     @pytest.mark.asyncio
     async def test_update_registry_after_sync_success(
-        self, async_synchronizer, sample_repo_config
+        self, async_synchronizer, shared_repo_config
     ):
         """Test async registry update after successful sync."""
         sync_result = {"commits_after": 105}
 
-        mock_repo_wrapper = mock.Mock()
-        mock_repo_wrapper.list_branches.return_value = ["main", "develop", "feature"]
+        async def run_in_executor(func, *args):
+            return func(*args)
 
-        with mock.patch(
-            "ca_bhfuil.core.git.repository.Repository", return_value=mock_repo_wrapper
-        ):
-            async_synchronizer.git_manager.run_in_executor.side_effect = [
-                mock_repo_wrapper,  # Repository creation
-                ["main", "develop", "feature"],  # list_branches call
-            ]
+        async_synchronizer.git_manager.run_in_executor.side_effect = run_in_executor
 
-            await async_synchronizer._update_registry_after_sync(
-                sample_repo_config, sync_result
-            )
+        await async_synchronizer._update_registry_after_sync(
+            shared_repo_config, sync_result
+        )
 
-            async_synchronizer.repo_registry.update_repository_stats.assert_called_once_with(
-                "test-repo", 105, 3
-            )
+        async_synchronizer.git_manager.run_in_executor.assert_awaited_once()
+        # main, feature and stable; the repository has no remotes
+        async_synchronizer.repo_registry.update_repository_stats.assert_called_once_with(
+            "test-repo", 105, 3
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_registry_after_sync_reuses_branch_count(
+        self, async_synchronizer, sample_repo_config
+    ):
+        """Test the branch count from the sync result skips reopening the repo."""
+        sync_result = {"commits_after": 105, "branch_count": 7}
+
+        await async_synchronizer._update_registry_after_sync(
+            sample_repo_config, sync_result
+        )
+
+        async_synchronizer.git_manager.run_in_executor.assert_not_awaited()
+        async_synchronizer.repo_registry.update_repository_stats.assert_called_once_with(
+            "test-repo", 105, 7
+        )
 
     @pytest.mark.asyncio
     async def test_update_registry_after_sync_exception(
@@ -314,7 +465,9 @@ class TestAsyncRepositorySynchronizer:
         )
 
     @pytest.mark.asyncio
-    async def test_sync_repositories_concurrently_success(self, async_synchronizer):
+    async def test_sync_repositories_concurrently_success(
+        self, async_synchronizer, monkeypatch
+    ):
         """Test concurrent synchronization of multiple repositories."""
         repo_names = ["repo1", "repo2", "repo3"]
 
@@ -323,69 +476,177 @@ class TestAsyncRepositorySynchronizer:
             success=True, duration=1.0, result={}
         )
 
-        with mock.patch.object(
-            async_synchronizer, "sync_repository", return_value=success_result
-        ):
-            results = await async_synchronizer.sync_repositories_concurrently(
-                repo_names
-            )
+        monkeypatch.setattr(
+            async_synchronizer,
+            "_sync_repository",
+            mock.AsyncMock(return_value=success_result),
+        )
+        results = await async_synchronizer.sync_repositories_concurrently(repo_names)
 
-            assert len(results) == 3
-            assert all(r.success for r in results)
+        assert len(results) == 3
+        assert all(r.success for r in results)
 
     @pytest.mark.asyncio
     async def test_sync_repositories_concurrently_with_failures(
-        self, async_synchronizer
+        self, async_synchronizer, monkeypatch
     ):
         """Test concurrent synchronization with some failures."""
         repo_names = ["repo1", "repo2", "repo3"]
 
         # Mock mixed results
-        def mock_sync_side_effect(repo_name):
+        def mock_sync_side_effect(repo_name, deferred):
             if repo_name == "repo2":
                 return results_models.OperationResult(
                     success=False, duration=0.5, error="Sync failed"
                 )
             return results_models.OperationResult(success=True, duration=1.0, result={})
 
-        with mock.patch.object(
-            async_synchronizer, "sync_repository", side_effect=mock_sync_side_effect
-        ):
-            results = await async_synchronizer.sync_repositories_concurrently(
-                repo_names
-            )
+        monkeypatch.setattr(
+            async_synchronizer,
+            "_sync_repository",
+            mock.AsyncMock(side_effect=mock_sync_side_effect),
+        )
+        results = await async_synchronizer.sync_repositories_concurrently(repo_names)
 
-            assert len(results) == 3
-            assert results[0].success is True
-            assert results[1].success is False
-            assert results[2].success is True
+        assert len(results) == 3
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[2].success is True
 
     @pytest.mark.asyncio
     async def test_sync_repositories_concurrently_with_exceptions(
-        self, async_synchronizer
+        self, async_synchronizer, monkeypatch
     ):
         """Test concurrent synchronization with exceptions."""
         repo_names = ["repo1", "repo2"]
 
-        async def mock_sync_side_effect(repo_name):
+        async def mock_sync_side_effect(repo_name, deferred):
             if repo_name == "repo1":
                 raise Exception("Sync exception")
             return results_models.OperationResult(success=True, duration=1.0, result={})
 
-        with mock.patch.object(
-            async_synchronizer, "sync_repository", side_effect=mock_sync_side_effect
-        ):
-            results = await async_synchronizer.sync_repositories_concurrently(
-                repo_names
-            )
+        monkeypatch.setattr(
+            async_synchronizer,
+            "_sync_repository",
+            mock.AsyncMock(side_effect=mock_sync_side_effect),
+        )
+        results = await async_synchronizer.sync_repositories_concurrently(repo_names)
 
-            assert len(results) == 2
-            assert results[0].success is False  # Exception converted to failed result
-            assert "Exception during sync" in results[0].error
-            assert results[1].success is True
+        assert len(results) == 2
+        assert results[0].success is False  # Exception converted to failed result
+        assert "Exception during sync" in results[0].error
+        assert results[1].success is True
 
     @pytest.mark.asyncio
-    async def test_sync_all_repositories_success(self, async_synchronizer):
+    async def test_sync_repositories_concurrently_overlaps_syncs(
+        self, mock_config_manager, mock_repo_registry, mock_git_manager
+    ):
+        """Test repositories sync in parallel up to the configured limit."""
+        synchronizer = async_sync.AsyncRepositorySynchronizer(
+            mock_config_manager,
+            mock_repo_registry,
+            mock_git_manager,
+            max_concurrent_syncs=2,
+        )
+        active = 0
+        peak = 0
+
+        async def get_repository_config_by_name(repo_name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        mock_config_manager.get_repository_config_by_name.side_effect = (
+            get_repository_config_by_name
+        )
+
+        results = await synchronizer.sync_repositories_concurrently(
+            ["repo1", "repo2", "repo3", "repo4"]
+        )
+
+        assert len(results) == 4
+        assert peak == 2
+
+    @pytest.fixture
+    def distinct_repos(self, async_synchronizer, configured_git_repo):
+        """Serve repo1-repo3 as distinct configs with distinct sync results.
+
+        Returns:
+            (commit count, branch count) the sync reports for each repository
+        """
+        counts = {"repo1": (5001, 1), "repo2": (5002, 2), "repo3": (5003, 3)}
+        async_synchronizer.config_manager.get_repository_config_by_name.side_effect = (
+            lambda name: configured_git_repo.model_copy(update={"name": name})
+        )
+        async_synchronizer.git_manager.run_in_executor.side_effect = (
+            lambda _func, repo_config: {
+                "success": True,
+                "commits_after": counts[repo_config.name][0],
+                "branch_count": counts[repo_config.name][1],
+            }
+        )
+        return counts
+
+    @pytest.mark.asyncio
+    async def test_sync_repositories_concurrently_bulk_stats(
+        self, async_synchronizer, distinct_repos, monkeypatch
+    ):
+        """Test registered repositories get their stats in one bulk update."""
+        registry = async_synchronizer.repo_registry
+        registry.registered_repository_names.return_value = {"repo1", "repo2"}
+        monkeypatch.setattr(
+            async_sync.manager_factory, "get_repository_manager", mock.AsyncMock()
+        )
+
+        results = await async_synchronizer.sync_repositories_concurrently(
+            ["repo1", "repo2", "repo3"]
+        )
+
+        assert all(r.success for r in results)
+        # repo3 is not registered yet, so it is written straight away
+        registry.update_repository_stats.assert_awaited_once_with("repo3", 5003, 3)
+        registry.update_repository_stats_bulk.assert_awaited_once()
+        (stats_batch,) = registry.update_repository_stats_bulk.await_args.args
+        assert sorted(stats_batch) == [("repo1", 5001, 1), ("repo2", 5002, 2)]
+
+    @pytest.mark.asyncio
+    async def test_sync_repositories_concurrently_final_stats(
+        self, async_synchronizer, distinct_repos, monkeypatch
+    ):
+        """Test the database sync writes the stored stats last for every repo."""
+        stored = {}
+        registry = async_synchronizer.repo_registry
+        registry.registered_repository_names.return_value = {"repo1", "repo2"}
+        registry.update_repository_stats.side_effect = lambda name, commits, branches: (
+            stored.__setitem__(name, (commits, branches))
+        )
+        registry.update_repository_stats_bulk.side_effect = lambda stats: stored.update(
+            (name, (commits, branches)) for name, commits, branches in stats
+        )
+
+        # The database sync stores fewer commits than the full history walk
+        async def sync_to_database(repo_config):
+            commits, branches = distinct_repos[repo_config.name]
+            stored[repo_config.name] = (commits - 4000, branches)
+
+        monkeypatch.setattr(async_synchronizer, "_sync_to_database", sync_to_database)
+
+        results = await async_synchronizer.sync_repositories_concurrently(
+            ["repo1", "repo2", "repo3"]
+        )
+
+        assert all(r.success for r in results)
+        registry.update_repository_stats_bulk.assert_awaited_once()
+        assert stored == {
+            "repo1": (1001, 1),
+            "repo2": (1002, 2),
+            "repo3": (1003, 3),
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_all_repositories_success(self, async_synchronizer, monkeypatch):
         """Test syncing all repositories."""
         repo1 = config.RepositoryConfig(name="repo1", source={"url": "url1"})
         repo2 = config.RepositoryConfig(name="repo2", source={"url": "url2"})
@@ -400,15 +661,15 @@ class TestAsyncRepositorySynchronizer:
             success=True, duration=1.0, result={}
         )
 
-        with mock.patch.object(
+        monkeypatch.setattr(
             async_synchronizer,
             "sync_repositories_concurrently",
-            return_value=[success_result, success_result],
-        ):
-            results = await async_synchronizer.sync_all_repositories()
+            mock.AsyncMock(return_value=[success_result, success_result]),
+        )
+        results = await async_synchronizer.sync_all_repositories()
 
-            assert len(results) == 2
-            assert all(r.success for r in results)
+        assert len(results) == 2
+        assert all(r.success for r in results)
 
     @pytest.mark.asyncio
     async def test_sync_all_repositories_empty(self, async_synchronizer):
@@ -436,62 +697,44 @@ class TestAsyncRepositorySynchronizer:
             "branch_count": 5,
         }
 
-        with mock.patch.object(
-            async_synchronizer.repo_registry,
-            "get_repository_state",
-            return_value=expected_status,
-        ):
-            status = await async_synchronizer.get_sync_status("test-repo")
-
-        assert status == expected_status
-
-    @pytest.mark.asyncio
-    async def test_get_sync_status_exception(self, async_synchronizer):
-        """Test getting sync status with exception."""
-        async_synchronizer.repo_registry.get_repository_state.side_effect = Exception(
-            "Status error"
+        async_synchronizer.repo_registry.get_repository_state.return_value = (
+            expected_status
         )
-
         status = await async_synchronizer.get_sync_status("test-repo")
 
-        assert status["repository"] == "test-repo"
-        assert status["success"] is False
-        assert "Status error" in status["error"]
+        assert status == expected_status
 
     @pytest.mark.asyncio
-    async def test_check_for_updates_success(self, async_synchronizer):
+    async def test_check_for_updates_success(
+        self, async_synchronizer, sample_repo_config
+    ):
         """Test checking for updates."""
-        repo_config = config.RepositoryConfig(
-            name="test-repo", source={"url": "https://github.com/test/repo.git"}
-        )
-        with (
-            mock.patch.object(
-                async_synchronizer.config_manager,
-                "get_repository_config_by_name",
-                return_value=repo_config,
-            ),
-            mock.patch("pathlib.Path.exists", return_value=True),
-        ):
-            result = await async_synchronizer.check_for_updates("test-repo")
+        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
+            sample_repo_config
+        )
+
+        result = await async_synchronizer.check_for_updates("test-repo")
 
         assert result["success"] is True
         assert result["updates_available"] is False
 
     @pytest.mark.asyncio
-    async def test_check_for_updates_exception(self, async_synchronizer):
-        """Test checking for updates with exception."""
-        async_synchronizer.config_manager.get_repository_config_by_name.side_effect = (
-            Exception("Update check error")
+    async def test_check_for_updates_path_not_exists(
+        self, async_synchronizer, sample_repo_config, repo_path_mock, temp_repo_path
+    ):
+        """Test checking for updates when the repository path is missing."""
+        repo_path_mock.return_value = temp_repo_path / "missing"
+        async_synchronizer.config_manager.get_repository_config_by_name.return_value = (
+            sample_repo_config
         )
 
         result = await async_synchronizer.check_for_updates("test-repo")
 
-        assert result["repository"] == "test-repo"
         assert result["success"] is False
-        assert "Update check error" in result["error"]
+        assert "does not exist" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_get_all_sync_status_success(self, async_synchronizer):
+    async def test_get_all_sync_status_success(self, async_synchronizer, monkeypatch):
         """Test getting sync status for all repositories."""
         repo1 = config.RepositoryConfig(name="repo1", source={"url": "url1"})
         repo2 = config.RepositoryConfig(name="repo2", source={"url": "url2"})
@@ -504,14 +747,16 @@ class TestAsyncRepositorySynchronizer:
         status1 = {"repository": "repo1", "can_sync": True}
         status2 = {"repository": "repo2", "can_sync": False}
 
-        with mock.patch.object(
-            async_synchronizer, "get_sync_status", side_effect=[status1, status2]
-        ):
-            status_list = await async_synchronizer.get_all_sync_status()
+        monkeypatch.setattr(
+            async_synchronizer,
+            "get_sync_status",
+            mock.AsyncMock(side_effect=[status1, status2]),
+        )
+        status_list = await async_synchronizer.get_all_sync_status()
 
-            assert len(status_list) == 2
-            assert status_list[0] == status1
-            assert status_list[1] == status2
+        assert len(status_list) == 2
+        assert status_list[0] == status1
+        assert status_list[1] == status2
 
     @pytest.mark.asyncio
     async def test_get_all_sync_status_empty(self, async_synchronizer):
@@ -526,7 +771,9 @@ class TestAsyncRepositorySynchronizer:
         assert len(status_list) == 0
 
     @pytest.mark.asyncio
-    async def test_get_all_sync_status_with_exceptions(self, async_synchronizer):
+    async def test_get_all_sync_status_with_exceptions(
+        self, async_synchronizer, monkeypatch
+    ):
         """Test getting sync status with some exceptions."""
         repo1 = config.RepositoryConfig(name="repo1", source={"url": "url1"})
         repo2 = config.RepositoryConfig(name="repo2", source={"url": "url2"})
@@ -541,19 +788,21 @@ class TestAsyncRepositorySynchronizer:
                 raise Exception("Status error")
             return {"repository": repo_name, "can_sync": True}
 
-        with mock.patch.object(
-            async_synchronizer, "get_sync_status", side_effect=mock_status_side_effect
-        ):
-            status_list = await async_synchronizer.get_all_sync_status()
+        monkeypatch.setattr(
+            async_synchronizer,
+            "get_sync_status",
+            mock.AsyncMock(side_effect=mock_status_side_effect),
+        )
+        status_list = await async_synchronizer.get_all_sync_status()
 
-            assert len(status_list) == 2
-            assert status_list[0]["repository"] == "repo1"
-            assert status_list[0]["success"] is False
-            assert status_list[1]["repository"] == "repo2"
-            assert status_list[1]["can_sync"] is True
+        assert len(status_list) == 2
+        assert status_list[0]["repository"] == "repo1"
+        assert status_list[0]["success"] is False
+        assert status_list[1]["repository"] == "repo2"
+        assert status_list[1]["can_sync"] is True
 
     @pytest.mark.asyncio
-    async def test_get_sync_summary_success(self, async_synchronizer):
+    async def test_get_sync_summary_success(self, async_synchronizer, monkeypatch):
         """Test getting sync summary."""
         status_list = [
             {"repository": "repo1", "can_sync": True, "success": True},
@@ -566,24 +815,22 @@ class TestAsyncRepositorySynchronizer:
             "total_branches": 50,
         }
 
-        with (
-            mock.patch.object(
-                async_synchronizer, "get_all_sync_status", return_value=status_list
-            ),
-            mock.patch.object(
-                async_synchronizer.repo_registry,
-                "get_registry_stats",
-                return_value=registry_stats,
-            ),
-        ):
-            summary = await async_synchronizer.get_sync_summary()
+        monkeypatch.setattr(
+            async_synchronizer,
+            "get_all_sync_status",
+            mock.AsyncMock(return_value=status_list),
+        )
+        async_synchronizer.repo_registry.get_registry_stats.return_value = (
+            registry_stats
+        )
+        summary = await async_synchronizer.get_sync_summary()
 
-            assert summary["total_repositories"] == 3
-            assert summary["can_sync"] == 2
-            assert summary["cannot_sync"] == 1
-            assert summary["has_errors"] == 1
-            assert summary["registry_stats"] == registry_stats
-            assert "last_check" in summary
+        assert summary["total_repositories"] == 3
+        assert summary["can_sync"] == 2
+        assert summary["cannot_sync"] == 1
+        assert summary["has_errors"] == 1
+        assert summary["registry_stats"] == registry_stats
+        assert "last_check" in summary
 
     def test_shutdown(self, async_synchronizer):
         """Test async synchronizer shutdown."""
@@ -594,6 +841,12 @@ class TestAsyncRepositorySynchronizer:
 class TestAsyncRepositorySynchronizerGlobalInstance:
     """Test global async repository synchronizer instance."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_global_synchronizer(self):
+        """Do not leave a synchronizer in the process-wide global."""
+        yield
+        async_sync.shutdown_global_synchronizer()
+
     @pytest.mark.asyncio
     async def test_get_async_repository_synchronizer(self):
         """Test getting global async repository synchronizer."""
@@ -603,3 +856,13 @@ class TestAsyncRepositorySynchronizerGlobalInstance:
         # Should return the same instance
         assert sync1 is sync2
         assert isinstance(sync1, async_sync.AsyncRepositorySynchronizer)
+
+    @pytest.mark.asyncio
+    async def test_shutdown_global_synchronizer(self):
+        """Test shutting down the global synchronizer replaces it on next use."""
+        sync1 = await async_sync.get_async_repository_synchronizer()
+
+        async_sync.shutdown_global_synchronizer()
+        sync2 = await async_sync.get_async_repository_synchronizer()
+
+        assert sync2 is not sync1
@@ -67,8 +67,7 @@ class TestBaseManager:
     @pytest.fixture
     async def db_session(self, tmp_path):
         """Provide a test database session."""
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
+        db_path = alembic.copy_test_database(tmp_path / "test.db")
 
         test_engine = db_engine.DatabaseEngine(db_path)
         session = sqlalchemy.ext.asyncio.AsyncSession(test_engine.engine)
@@ -235,8 +234,7 @@ class TestManagerRegistry:
     @pytest.fixture
     async def db_session(self, tmp_path):
         """Provide a test database session."""
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
+        db_path = alembic.copy_test_database(tmp_path / "test.db")
 
         test_engine = db_engine.DatabaseEngine(db_path)
         session = sqlalchemy.ext.asyncio.AsyncSession(test_engine.engine)
@@ -2,6 +2,7 @@
 
 import pathlib
 import tempfile
+import types
 from unittest import mock
 
 import pytest
@@ -9,6 +10,13 @@ import pytest
 from ca_bhfuil.cli import completion
 
 
+def _global_config(*repo_names):
+    """Build a stand-in global configuration listing the named repositories."""
+    return types.SimpleNamespace(
+        repos=[types.SimpleNamespace(name=name) for name in repo_names]
+    )
+
+
 class TestCompletionFunctions:
     """Test individual completion functions."""
 
@@ -111,15 +119,7 @@ class TestCompletionFunctions:
     def test_complete_repository_name_success(self):
         """Test repository name completion with valid config."""
         # Mock configuration
-        mock_repo1 = mock.Mock()
-        mock_repo1.name = "test-repo-1"
-        mock_repo2 = mock.Mock()
-        mock_repo2.name = "test-repo-2"
-        mock_repo3 = mock.Mock()
-        mock_repo3.name = "other-repo"
-
-        mock_global_config = mock.Mock()
-        mock_global_config.repos = [mock_repo1, mock_repo2, mock_repo3]
+        mock_global_config = _global_config("test-repo-1", "test-repo-2", "other-repo")
 
         mock_config_manager = mock.Mock()
         mock_config_manager.load_configuration.return_value = mock_global_config
@@ -409,8 +409,7 @@ class TestCompletionEdgeCases:
 
     def test_complete_repository_name_empty_config(self):
         """Test repository name completion with empty configuration."""
-        mock_global_config = mock.Mock()
-        mock_global_config.repos = []
+        mock_global_config = _global_config()
 
         mock_config_manager = mock.Mock()
         mock_config_manager.load_configuration.return_value = mock_global_config
@@ -465,13 +464,7 @@ class TestCompletionEdgeCases:
     def test_complete_repository_name_unicode_handling(self):
         """Test repository name completion with unicode characters."""
         # Mock configuration with unicode repo names
-        mock_repo1 = mock.Mock()
-        mock_repo1.name = "test-repo-ñame"
-        mock_repo2 = mock.Mock()
-        mock_repo2.name = "test-repo-正常"
-
-        mock_global_config = mock.Mock()
-        mock_global_config.repos = [mock_repo1, mock_repo2]
+        mock_global_config = _global_config("test-repo-ñame", "test-repo-正常")
 
         mock_config_manager = mock.Mock()
         mock_config_manager.load_configuration.return_value = mock_global_config
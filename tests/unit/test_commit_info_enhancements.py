@@ -241,6 +241,29 @@ class TestCommitInfoBusinessLogic:
         """Test pattern matching with empty pattern."""
         assert feature_commit.matches_pattern("")  # Empty string matches everything
 
+    def test_matches_pattern_does_not_span_fields(self, feature_commit):
+        """Test a pattern cannot match across the boundary of two fields."""
+        boundary = f"{feature_commit.author_name[-3:]}\0{feature_commit.author_email}"
+        assert not feature_commit.matches_pattern(boundary)
+
+    def test_compile_pattern(self, feature_commit, refactor_commit):
+        """Test compiled matchers are cached and match like matches_pattern."""
+        matcher = commit_models.compile_pattern("ALICE")
+
+        assert commit_models.compile_pattern("ALICE") is matcher
+        assert matcher(feature_commit)
+        assert not matcher(refactor_commit)
+
+    def test_search_text_follows_copied_fields(self, feature_commit):
+        """Test a copy with updated fields is searched on its own values."""
+        assert feature_commit.matches_pattern("alice")
+
+        renamed = feature_commit.model_copy(update={"author_name": "Bob"})
+
+        assert renamed.matches_pattern("bob")
+        assert not renamed.matches_pattern("alice developer")
+        assert "search_text" not in renamed.model_dump()
+
     def test_calculate_impact_score_feature(self, feature_commit):
         """Test impact score calculation for feature commit."""
         score = feature_commit.calculate_impact_score()
@@ -323,8 +346,9 @@ class TestCommitInfoBusinessLogic:
     def test_get_display_summary_medium_impact(self, feature_commit):
         """Test display summary for medium impact commit."""
         # Modify to have medium impact
-        feature_commit.files_changed = 2
-        feature_commit.insertions = 30
+        feature_commit = feature_commit.model_copy(
+            update={"files_changed": 2, "insertions": 30}
+        )
 
         summary = feature_commit.get_display_summary()
 
@@ -2,43 +2,63 @@
 
 import pathlib
 import tempfile
-import unittest.mock
 
 import pytest
 
 from ca_bhfuil.core.managers import factory as manager_factory
 from ca_bhfuil.core.managers import repository as repository_manager
 from tests.fixtures import alembic
+from tests.fixtures import managers
 
 
-class TestManagerFactory:
-    """Test ManagerFactory functionality."""
+pytestmark = pytest.mark.usefixtures("mock_repo_class")
+
 
-    @pytest.fixture
-    async def factory(self, tmp_path):
-        """Provide a manager factory with test database."""
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
+def _factory_state(factory):
+    """Return (initialized, has database manager, has registry) for a factory."""
+    return (
+        factory._initialized,
+        factory._db_manager is not None,
+        factory._registry is not None,
+    )
 
-        factory = manager_factory.ManagerFactory(db_path)
+
+@pytest.fixture
+async def factory(clean_database_engine):
+    """Provide a manager factory backed by the shared test database engine."""
+    async with managers.make_factory(database_engine=clean_database_engine) as factory:
         yield factory
-        await factory.close()
 
-    async def test_factory_initialization(self, tmp_path):
-        """Test factory initialization process."""
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
 
-        factory = manager_factory.ManagerFactory(db_path)
+@pytest.fixture
+async def prepared_repo_manager(factory, tmp_path, mock_repo_class):
+    """Provide a repository manager created through the factory.
 
-        assert factory._initialized is False
-        assert factory._db_manager is None
+    Returns:
+        Tuple of (repository manager, mocked git repository).
+    """
+    repo_manager = await factory.get_repository_manager(tmp_path / "repo")
+    return repo_manager, mock_repo_class.return_value
+
+
+@pytest.fixture(scope="module")
+def global_db(tmp_path_factory):
+    """Provide one migrated database shared by the global factory tests."""
+    return alembic.copy_test_database(tmp_path_factory.mktemp("global") / "global.db")
+
+
+class TestManagerFactory:
+    """Test ManagerFactory functionality."""
+
+    async def test_factory_initialization(self, migrated_db):
+        """Test factory initialization process."""
+        factory = manager_factory.ManagerFactory(migrated_db)
+
+        assert _factory_state(factory) == (False, False, True)
 
         await factory.initialize()
 
-        assert factory._initialized is True
-        assert factory._db_manager is not None
-        assert factory._registry is not None
+        assert _factory_state(factory) == (True, True, True)
 
         await factory.close()
 
@@ -47,18 +67,11 @@ class TestManagerFactory:
         with tempfile.TemporaryDirectory() as temp_dir:
             repo_path = pathlib.Path(temp_dir)
 
-            # Mock git repository
-            with unittest.mock.patch(
-                "ca_bhfuil.core.git.repository.Repository"
-            ) as mock_repo_class:
-                mock_repo = unittest.mock.MagicMock()
-                mock_repo_class.return_value = mock_repo
+            repo_manager = await factory.get_repository_manager(repo_path)
 
-                repo_manager = await factory.get_repository_manager(repo_path)
-
-                assert isinstance(repo_manager, repository_manager.RepositoryManager)
-                assert repo_manager.repository_path == repo_path
-                assert repo_manager._db_manager is factory._db_manager
+            assert isinstance(repo_manager, repository_manager.RepositoryManager)
+            assert repo_manager.repository_path == repo_path
+            assert repo_manager._db_manager is factory._db_manager
 
     async def test_get_multiple_repository_managers(self, factory):
         """Test creating multiple repository managers shares resources."""
@@ -68,56 +81,48 @@ class TestManagerFactory:
             repo_path1.mkdir()
             repo_path2.mkdir()
 
-            # Mock git repository
-            with unittest.mock.patch(
-                "ca_bhfuil.core.git.repository.Repository"
-            ) as mock_repo_class:
-                mock_repo_class.return_value = unittest.mock.MagicMock()
-
-                repo_manager1 = await factory.get_repository_manager(repo_path1)
-                repo_manager2 = await factory.get_repository_manager(repo_path2)
+            repo_manager1 = await factory.get_repository_manager(repo_path1)
+            repo_manager2 = await factory.get_repository_manager(repo_path2)
 
-                # Should share the same database manager
-                assert repo_manager1._db_manager is repo_manager2._db_manager
-                assert repo_manager1._db_manager is factory._db_manager
+            # Should share the same database manager
+            assert repo_manager1._db_manager is repo_manager2._db_manager
+            assert repo_manager1._db_manager is factory._db_manager
 
-    async def test_factory_as_context_manager(self, tmp_path):
+    async def test_factory_as_context_manager(self, migrated_db):
         """Test factory as async context manager."""
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
-
-        async with manager_factory.ManagerFactory(db_path) as factory:
-            assert factory._initialized is True
-            assert factory._db_manager is not None
+        async with manager_factory.ManagerFactory(migrated_db) as factory:
+            assert _factory_state(factory) == (True, True, True)
 
         # Should be cleaned up after context exit
-        assert factory._initialized is False
-        assert factory._db_manager is None
+        assert _factory_state(factory) == (False, False, True)
 
-    async def test_factory_close_cleanup(self, factory):
+    async def test_factory_close_cleanup(self, migrated_db):
         """Test that factory close cleans up all resources."""
+        factory = manager_factory.ManagerFactory(migrated_db)
         with tempfile.TemporaryDirectory() as temp_dir:
             repo_path = pathlib.Path(temp_dir)
 
-            # Mock git repository
-            with unittest.mock.patch(
-                "ca_bhfuil.core.git.repository.Repository"
-            ) as mock_repo_class:
-                mock_repo_class.return_value = unittest.mock.MagicMock()
+            # Create a repository manager
+            await factory.get_repository_manager(repo_path)
 
-                # Create a repository manager
-                await factory.get_repository_manager(repo_path)
+            # Factory should have resources
+            assert _factory_state(factory) == (True, True, True)
 
-                # Factory should have resources
-                assert factory._initialized is True
-                assert factory._db_manager is not None
+            # Close factory
+            await factory.close()
 
-                # Close factory
-                await factory.close()
+            # Should be cleaned up
+            assert _factory_state(factory) == (False, False, True)
 
-                # Should be cleaned up
-                assert factory._initialized is False
-                assert factory._db_manager is None
+    async def test_factory_close_keeps_shared_engine(self, shared_database_engine):
+        """Test that closing a factory leaves an injected engine open."""
+        async with managers.make_factory(
+            database_engine=shared_database_engine
+        ) as factory:
+            assert factory._db_manager.engine is shared_database_engine
+            async_engine = shared_database_engine.engine
+
+        assert shared_database_engine._engine is async_engine
 
     async def test_get_registry(self, factory):
         """Test getting registry from factory."""
@@ -130,62 +135,32 @@ class TestManagerFactory:
 class TestGlobalFactory:
     """Test global factory convenience functions."""
 
-    async def test_get_global_factory(self, tmp_path):
+    async def test_get_global_factory(self, global_db):
         """Test getting global factory instance."""
-        # Clean up any existing global factory first
-        await manager_factory.close_global_factory()
-
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
-
         # Get global factory
-        factory1 = await manager_factory.get_manager_factory(db_path)
-        factory2 = await manager_factory.get_manager_factory(db_path)
+        factory1 = await manager_factory.get_manager_factory(global_db)
+        factory2 = await manager_factory.get_manager_factory(global_db)
 
         # Should be the same instance
         assert factory1 is factory2
         assert factory1._initialized is True
 
-        # Clean up
-        await manager_factory.close_global_factory()
-
-    async def test_get_repository_manager_convenience(self, tmp_path):
+    async def test_get_repository_manager_convenience(self, global_db):
         """Test convenience function for getting repository manager."""
-        # Clean up any existing global factory first
-        await manager_factory.close_global_factory()
-
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
-
         with tempfile.TemporaryDirectory() as temp_dir:
             repo_path = pathlib.Path(temp_dir)
 
-            # Mock git repository
-            with unittest.mock.patch(
-                "ca_bhfuil.core.git.repository.Repository"
-            ) as mock_repo_class:
-                mock_repo_class.return_value = unittest.mock.MagicMock()
-
-                repo_manager = await manager_factory.get_repository_manager(
-                    repo_path, db_path
-                )
+            repo_manager = await manager_factory.get_repository_manager(
+                repo_path, global_db
+            )
 
-                assert isinstance(repo_manager, repository_manager.RepositoryManager)
-                assert repo_manager.repository_path == repo_path
-
-        # Clean up
-        await manager_factory.close_global_factory()
+            assert isinstance(repo_manager, repository_manager.RepositoryManager)
+            assert repo_manager.repository_path == repo_path
 
-    async def test_close_global_factory(self, tmp_path):
+    async def test_close_global_factory(self, global_db):
         """Test closing global factory."""
-        # Clean up any existing global factory first
-        await manager_factory.close_global_factory()
-
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
-
         # Create global factory
-        factory = await manager_factory.get_manager_factory(db_path)
+        factory = await manager_factory.get_manager_factory(global_db)
         assert factory is not None
         assert factory._initialized is True
 
@@ -195,44 +170,29 @@ class TestGlobalFactory:
         # Global factory should be None
         assert manager_factory._global_factory is None
 
-    async def test_multiple_calls_to_close_global_factory(self):
-        """Test that multiple calls to close_global_factory don't error."""
-        await manager_factory.close_global_factory()
-        await manager_factory.close_global_factory()  # Should not error
-
     @pytest.fixture(autouse=True)
     async def cleanup_global_factory(self):
-        """Ensure global factory is cleaned up after each test."""
+        """Ensure no global factory leaks into or out of each test.
+
+        Closing on both sides of every test also covers repeated calls to
+        close_global_factory, e.g. after test_close_global_factory.
+        """
+        await manager_factory.close_global_factory()
         yield
         await manager_factory.close_global_factory()
+        assert manager_factory._global_factory is None
 
 
 class TestFactoryIntegration:
     """Test factory integration with real components."""
 
-    async def test_factory_with_real_database_operations(self, tmp_path):
+    async def test_factory_with_real_database_operations(self, prepared_repo_manager):
         """Test factory with actual database operations."""
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
-
-        async with manager_factory.ManagerFactory(db_path) as factory:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                repo_path = pathlib.Path(temp_dir)
-
-                # Mock git repository to avoid needing actual git repo
-                with unittest.mock.patch(
-                    "ca_bhfuil.core.git.repository.Repository"
-                ) as mock_repo_class:
-                    mock_repo = unittest.mock.MagicMock()
-                    mock_repo.head_is_unborn = False
-                    mock_repo.get_repository_stats.return_value = {"total_branches": 1}
-                    mock_repo_class.return_value = mock_repo
-
-                    repo_manager = await factory.get_repository_manager(repo_path)
-
-                    # Should be able to sync with database
-                    await repo_manager.sync_with_database()
-
-                    # Should be able to analyze repository
-                    result = await repo_manager.analyze_repository()
-                    assert result.success is True
+        repo_manager, _ = prepared_repo_manager
+
+        # Should be able to sync with database
+        await repo_manager.sync_with_database()
+
+        # Should be able to analyze repository
+        result = await repo_manager.analyze_repository()
+        assert result.success is True
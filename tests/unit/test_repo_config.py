@@ -1,9 +1,10 @@
 """Tests for repository configuration management."""
 
-import pathlib
-import tempfile
+import json
+import os
 from unittest import mock
 
+import pydantic
 import pytest
 import yaml
 
@@ -40,6 +41,41 @@ class TestRepositoryConfig:
             "state/ca-bhfuil/github.com/torvalds/linux"
         )
 
+    def test_repository_paths_follow_source_and_environment(
+        self, tmp_path, monkeypatch
+    ):
+        """Test derived paths reflect copied sources and XDG directory changes."""
+        repo_config = config.RepositoryConfig(
+            name="test-repo",
+            source={"url": "https://github.com/a/b.git", "type": "git"},
+        )
+        assert repo_config.repo_path.parts[-3:] == ("github.com", "a", "b")
+
+        copied = repo_config.model_copy(
+            update={"source": {"url": "https://github.com/c/d.git", "type": "git"}}
+        )
+        assert copied.url_path == "github.com/c/d"
+        assert copied.repo_path.parts[-3:] == ("github.com", "c", "d")
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+        assert repo_config.repo_path.is_relative_to(tmp_path / "cache")
+        assert repo_config.state_path.is_relative_to(tmp_path / "state")
+        assert "url_path" not in repo_config.model_dump()
+
+    def test_repository_config_is_frozen(self):
+        """Test loaded repository configuration cannot be mutated."""
+        repo_config = config.RepositoryConfig(
+            name="test-repo",
+            source={"url": "https://github.com/test/repo.git", "type": "git"},
+        )
+
+        with pytest.raises(pydantic.ValidationError):
+            repo_config.name = "other"
+        with pytest.raises(pydantic.ValidationError):
+            repo_config.branches.max_branches = 1
+        assert hash(repo_config.sync) == hash(config.SyncConfig())
+
     def test_ssh_url_conversion(self):
         """Test SSH URL to path conversion."""
         repo_config = config.RepositoryConfig(
@@ -49,6 +85,30 @@ class TestRepositoryConfig:
 
         assert repo_config.url_path == "gitlab.example.com/group/project"
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("git@github.com:torvalds/linux", "github.com/torvalds/linux"),
+            ("HTTPS://github.com/a/b.git?ref=x#frag", "github.com/a/b"),
+            ("http://example.com:8080//group/repo.git", "example.com:8080/group/repo"),
+            ("file:///tmp/repo.git", "localhost/tmp/repo"),
+        ],
+    )
+    def test_url_path_forms(self, url, expected):
+        """Test URL path conversion for each supported URL form."""
+        repo_config = config.RepositoryConfig(name="repo", source={"url": url})
+
+        assert repo_config.url_path == expected
+
+    def test_unsupported_url(self):
+        """Test unsupported URL schemes are rejected."""
+        repo_config = config.RepositoryConfig(
+            name="repo", source={"url": "ftp://example.com/repo"}
+        )
+
+        with pytest.raises(ValueError, match="Unsupported URL format"):
+            _ = repo_config.url_path
+
     def test_complex_repository_config(self):
         """Test repository configuration with all options."""
         repo_config = config.RepositoryConfig(
@@ -88,6 +148,30 @@ class TestBranchConfig:
         with pytest.raises(ValueError, match="Invalid pattern"):
             config.BranchConfig(patterns=["[invalid"])
 
+    def test_matches(self):
+        """Test branch matching against include and exclude patterns."""
+        branch_config = config.BranchConfig(
+            patterns=["main", "stable/*"],
+            exclude_patterns=["stable/old-*"],
+        )
+
+        assert branch_config.matches("main")
+        assert branch_config.matches("stable/2024.1")
+        assert not branch_config.matches("stable/old-2019")
+        assert not branch_config.matches("feature/main")
+        assert config.BranchConfig().matches("anything")
+
+    def test_matches_shares_compiled_patterns(self):
+        """Test configurations with the same patterns reuse the compiled regex."""
+        first = config.BranchConfig(patterns=["main", "stable/*"])
+        second = config.BranchConfig(patterns=["main", "stable/*"])
+
+        first.matches("main")
+        hits = config._compile_globs.cache_info().hits
+        second.matches("main")
+
+        assert config._compile_globs.cache_info().hits > hits
+
 
 class TestAuthMethod:
     """Test authentication method configuration."""
@@ -128,21 +212,15 @@ class TestConfigManager:
     """Test configuration manager functionality."""
 
     @pytest.fixture
-    def temp_config_dir(self):
-        """Provide temporary configuration directory."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            yield pathlib.Path(tmp_dir)
-
-    @pytest.fixture
-    def config_manager(self, temp_config_dir):
+    def config_manager(self, tmp_path):
         """Provide configuration manager with temp directory."""
-        return config.ConfigManager(config_dir=temp_config_dir)
+        return config.ConfigManager(config_dir=tmp_path)
 
-    def test_config_manager_initialization(self, config_manager, temp_config_dir):
+    def test_config_manager_initialization(self, config_manager, tmp_path):
         """Test configuration manager initialization."""
-        assert config_manager.config_dir == temp_config_dir
-        assert config_manager.repositories_file == temp_config_dir / "repos.yaml"
-        assert config_manager.auth_file == temp_config_dir / "auth.yaml"
+        assert config_manager.config_dir == tmp_path
+        assert config_manager.repositories_file == tmp_path / "repos.yaml"
+        assert config_manager.auth_file == tmp_path / "auth.yaml"
 
     def test_empty_configuration(self, config_manager):
         """Test loading empty configuration."""
@@ -163,6 +241,32 @@ class TestConfigManager:
         # Check auth file permissions
         assert oct(config_manager.auth_file.stat().st_mode)[-3:] == "600"
 
+    def test_generated_auth_config_created_private(self, config_manager):
+        """Test the auth file is created 0600 rather than chmod-ed afterwards."""
+        old_umask = os.umask(0)
+        try:
+            with mock.patch("pathlib.Path.chmod") as mock_chmod:
+                config_manager.generate_default_config()
+        finally:
+            os.umask(old_umask)
+
+        mock_chmod.assert_not_called()
+        assert oct(config_manager.auth_file.stat().st_mode)[-3:] == "600"
+
+    def test_generated_auth_config_is_json(self, config_manager):
+        """Test the generated auth file is JSON and loads without YAML parsing."""
+        config_manager.generate_default_config()
+
+        auth_data = json.loads(config_manager.auth_file.read_text())
+        assert "github-default" in auth_data["auth_methods"]
+
+        with mock.patch("yaml.load") as mock_load:
+            auth_methods = config_manager.load_auth_config()
+
+        mock_load.assert_not_called()
+        assert auth_methods["github-default"].type == "ssh_key"
+        assert not (config_manager.config_dir / "auth.yaml.jcache").exists()
+
     def test_load_repository_configuration(self, config_manager):
         """Test loading repository configuration from file."""
         # Create test configuration
@@ -193,6 +297,112 @@ class TestConfigManager:
         assert global_config.repos[0].name == "test-repo"
         assert global_config.repos[1].name == "another-repo"
 
+    def test_load_configuration_reuses_cached_parse(self, config_manager):
+        """Test unchanged configuration files are only parsed once."""
+        test_config = {
+            "version": "1.0",
+            "repos": [
+                {
+                    "name": "test-repo",
+                    "source": {"url": "https://github.com/test/repo.git"},
+                }
+            ],
+        }
+
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump(test_config, f)
+
+        with mock.patch("yaml.load", wraps=yaml.load) as mock_load:
+            first = config_manager.load_configuration()
+            second = config.ConfigManager(
+                config_manager.config_dir
+            ).load_configuration()
+
+        assert mock_load.call_count == 1
+        assert first == second
+        assert first.repos[0] is not second.repos[0]
+
+    def test_load_configuration_reuses_validated_config(self, config_manager):
+        """Test reloading an unchanged file skips validation."""
+        test_config = {
+            "version": "1.0",
+            "repos": [
+                {
+                    "name": "test-repo",
+                    "source": {"url": "https://github.com/test/repo.git"},
+                }
+            ],
+            "settings": {"parallel_clones": 3},
+        }
+
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump(test_config, f)
+
+        first = config_manager.load_configuration()
+        with mock.patch.object(
+            config.GlobalConfig, "__init__", side_effect=AssertionError
+        ):
+            second = config_manager.load_configuration()
+
+        assert first == second
+        assert first.repos[0] is second.repos[0]
+
+        # Callers own the returned containers
+        first.repos.clear()
+        first.settings["parallel_clones"] = 1
+        third = config_manager.load_configuration()
+        assert [repo.name for repo in third.repos] == ["test-repo"]
+        assert third.settings == {"parallel_clones": 3}
+
+    def test_load_configuration_reparses_modified_file(self, config_manager):
+        """Test rewriting a configuration file invalidates the cached parse."""
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump({"version": "1.0", "repos": []}, f)
+        assert config_manager.load_configuration().repos == []
+
+        test_config = {
+            "version": "1.0",
+            "repos": [
+                {
+                    "name": "new-repo",
+                    "source": {"url": "https://github.com/test/new-repo.git"},
+                }
+            ],
+        }
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump(test_config, f)
+
+        global_config = config_manager.load_configuration()
+        assert [repo.name for repo in global_config.repos] == ["new-repo"]
+
+    def test_load_configuration_uses_json_sidecar(self, config_manager):
+        """Test a fresh process reads the JSON sidecar instead of the YAML."""
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump({"version": "1.0", "settings": {"parallel_clones": 3}}, f)
+
+        config_manager.load_configuration()
+        sidecar = config_manager.config_dir / "repos.yaml.jcache"
+        assert sidecar.exists()
+        assert oct(sidecar.stat().st_mode)[-3:] == "600"
+
+        config.clear_yaml_cache()
+        with mock.patch("yaml.load") as mock_load:
+            global_config = config_manager.load_configuration()
+
+        mock_load.assert_not_called()
+        assert global_config.settings == {"parallel_clones": 3}
+
+    def test_load_configuration_skips_sidecar_for_non_json_data(self, config_manager):
+        """Test YAML values without a JSON equivalent are not cached."""
+        config_manager.repositories_file.write_text(
+            "version: '1.0'\nsettings:\n  created: 2024-01-01\n"
+        )
+
+        global_config = config_manager.load_configuration()
+
+        assert str(global_config.settings["created"]) == "2024-01-01"
+        assert not (config_manager.config_dir / "repos.yaml.jcache").exists()
+
     def test_get_repository_by_url_path(self, config_manager):
         """Test getting repository configuration by URL path."""
         # Create test configuration
@@ -243,6 +453,32 @@ class TestConfigManager:
         assert repo_config is not None
         assert repo_config.name == "os-vif"
 
+    def test_repository_lookups_use_index(self, config_manager):
+        """Test lookups reuse the index until the configuration file changes."""
+        repo = {"name": "repo", "source": {"url": "https://github.com/a/repo.git"}}
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump({"version": "1.0", "repos": [repo]}, f)
+
+        with mock.patch.object(
+            config_manager,
+            "load_configuration",
+            wraps=config_manager.load_configuration,
+        ) as mock_load:
+            by_name = config_manager.get_repository_config_by_name("repo")
+            by_url = config_manager.get_repository_config_by_url(
+                "https://github.com/a/repo.git"
+            )
+            by_path = config_manager.get_repository_config("github.com/a/repo")
+
+        assert mock_load.call_count == 1
+        assert by_name is by_url is by_path
+
+        other = {"name": "other", "source": {"url": "https://github.com/b/other"}}
+        with config_manager.repositories_file.open("w") as f:
+            yaml.dump({"version": "1.0", "repos": [repo, other]}, f)
+
+        assert config_manager.get_repository_config_by_name("other") is not None
+
     def test_configuration_validation(self, config_manager):
         """Test configuration validation."""
         # Create configuration with errors
@@ -282,6 +518,28 @@ class TestConfigManager:
         assert any("duplicate" in error.lower() for error in errors)
         assert any("unknown auth key" in error.lower() for error in errors)
 
+    def test_validate_repositories(self):
+        """Test duplicate and auth checks report errors in a stable order."""
+        repos = [
+            config.RepositoryConfig(name=name, source={"url": url}, auth_key=auth_key)
+            for name, url, auth_key in [
+                ("a", "https://github.com/test/a.git", "missing"),
+                ("b", "https://github.com/test/a.git", "known"),
+                ("a", "https://github.com/test/c.git", None),
+            ]
+        ]
+
+        errors = config.validate_repositories(repos, {"known": config.AuthMethod()})
+
+        assert errors == [
+            "Duplicate repository names found",
+            "Duplicate repository URLs found",
+            "Repository 'a' references unknown auth key 'missing'",
+        ]
+        assert config.validate_repositories(repos[1:2], {}) == [
+            "Repository 'b' references unknown auth key 'known'"
+        ]
+
     def test_auth_configuration(self, config_manager):
         """Test authentication configuration loading."""
         # Create auth configuration
@@ -367,6 +625,15 @@ class TestXDGDirectories:
         cache_dir = config.get_cache_dir()
         assert str(cache_dir) == "/custom/cache/ca-bhfuil"
 
+    def test_directories_cached_per_environment(self):
+        """Test directory lookups are cached but follow environment changes."""
+        assert config.get_cache_dir() is config.get_cache_dir()
+
+        with mock.patch.dict("os.environ", {"XDG_CACHE_HOME": "/other/cache"}):
+            assert str(config.get_cache_dir()) == "/other/cache/ca-bhfuil"
+
+        assert str(config.get_cache_dir()) != "/other/cache/ca-bhfuil"
+
 
 class TestRealWorldConfiguration:
     """Test configuration with real-world repository examples."""
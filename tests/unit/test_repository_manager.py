@@ -1,31 +1,29 @@
 """Tests for RepositoryManager orchestration layer."""
 
 import datetime
-import pathlib
-import tempfile
 import unittest.mock
 
 import pytest
 import sqlalchemy.ext.asyncio
 
+from ca_bhfuil.core.git import repository as git_repository
 from ca_bhfuil.core.managers import repository as repository_manager
 from ca_bhfuil.core.models import commit as commit_models
 from ca_bhfuil.storage.database import engine as db_engine
-from tests.fixtures import alembic
 
 
 class TestRepositoryManager:
     """Test RepositoryManager functionality."""
 
     @pytest.fixture
-    async def db_session(self, tmp_path):
-        """Provide a test database session."""
-        # Create test database
-        db_path = tmp_path / "test.db"
-        await alembic.create_test_database(db_path)
+    async def db_session(self, migrated_db):
+        """Provide a test database session.
 
+        The database is copied from the session-wide migrated template
+        rather than running alembic for every test.
+        """
         # Create engine and session
-        test_engine = db_engine.DatabaseEngine(db_path)
+        test_engine = db_engine.DatabaseEngine(migrated_db)
         session = sqlalchemy.ext.asyncio.AsyncSession(test_engine.engine)
 
         yield session
@@ -34,62 +32,73 @@ class TestRepositoryManager:
         await session.close()
         await test_engine.close()
 
+    @pytest.fixture(scope="class")
+    def mock_git_repo_template(self):
+        """Build the mocked git repository once for the whole class.
+
+        Returns:
+            MagicMock configured with a single sample commit.
+        """
+        mock_repo = unittest.mock.MagicMock()
+
+        # Configure mock repository
+        mock_repo.head_is_unborn = False
+        mock_repo.get_repository_stats.return_value = {
+            "total_branches": 3,
+            "commit_count": 50,
+        }
+
+        # Mock the _repo.walk() method to return sample commits
+        mock_commit = unittest.mock.MagicMock()
+        mock_commit.id = "abc123def456789abc123def456789abc123def4"
+        mock_commit.message = "feat: Add sample feature"
+        mock_commit.author.name = "Test Author"
+        mock_commit.author.email = "test@example.com"
+        mock_commit.author.time = 1640995200  # 2022-01-01 00:00:00 UTC
+        mock_commit.author.offset = 0
+        mock_commit.committer.name = "Test Author"
+        mock_commit.committer.email = "test@example.com"
+        mock_commit.committer.time = 1640995200
+        mock_commit.committer.offset = 0
+        mock_commit.parents = []
+
+        mock_repo._repo.head.target = "abc123def456789abc123def456789abc123def4"
+        mock_repo._repo.walk.return_value = [mock_commit]
+
+        # Mock the conversion method
+        sample_commit = commit_models.CommitInfo(
+            sha="abc123def456789abc123def456789abc123def4",
+            short_sha="abc123d",
+            message="feat: Add sample feature",
+            author_name="Test Author",
+            author_email="test@example.com",
+            author_date=datetime.datetime(2022, 1, 1, 0, 0, 0),
+            committer_name="Test Author",
+            committer_email="test@example.com",
+            committer_date=datetime.datetime(2022, 1, 1, 0, 0, 0),
+            files_changed=3,
+            insertions=50,
+            deletions=10,
+        )
+        mock_repo._commit_to_model.return_value = sample_commit
+
+        return mock_repo
+
     @pytest.fixture
-    def mock_git_repo(self):
-        """Provide a mocked git repository."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = pathlib.Path(temp_dir)
-
-            # Mock the git repository
-            with unittest.mock.patch(
-                "ca_bhfuil.core.git.repository.Repository"
-            ) as mock_repo_class:
-                mock_repo = unittest.mock.MagicMock()
-                mock_repo_class.return_value = mock_repo
-
-                # Configure mock repository
-                mock_repo.repository_path = repo_path
-                mock_repo.head_is_unborn = False
-                mock_repo.get_repository_stats.return_value = {
-                    "total_branches": 3,
-                    "commit_count": 50,
-                }
-
-                # Mock the _repo.walk() method to return sample commits
-                mock_commit = unittest.mock.MagicMock()
-                mock_commit.id = "abc123def456789abc123def456789abc123def4"
-                mock_commit.message = "feat: Add sample feature"
-                mock_commit.author.name = "Test Author"
-                mock_commit.author.email = "test@example.com"
-                mock_commit.author.time = 1640995200  # 2022-01-01 00:00:00 UTC
-                mock_commit.author.offset = 0
-                mock_commit.committer.name = "Test Author"
-                mock_commit.committer.email = "test@example.com"
-                mock_commit.committer.time = 1640995200
-                mock_commit.committer.offset = 0
-                mock_commit.parents = []
-
-                mock_repo._repo.head.target = "abc123def456789abc123def456789abc123def4"
-                mock_repo._repo.walk.return_value = [mock_commit]
-
-                # Mock the conversion method
-                sample_commit = commit_models.CommitInfo(
-                    sha="abc123def456789abc123def456789abc123def4",
-                    short_sha="abc123d",
-                    message="feat: Add sample feature",
-                    author_name="Test Author",
-                    author_email="test@example.com",
-                    author_date=datetime.datetime(2022, 1, 1, 0, 0, 0),
-                    committer_name="Test Author",
-                    committer_email="test@example.com",
-                    committer_date=datetime.datetime(2022, 1, 1, 0, 0, 0),
-                    files_changed=3,
-                    insertions=50,
-                    deletions=10,
-                )
-                mock_repo._commit_to_model.return_value = sample_commit
-
-                yield repo_path, mock_repo
+    def mock_git_repo(self, mock_git_repo_template, tmp_path, monkeypatch):
+        """Provide the mocked git repository with fresh call history."""
+        mock_repo = mock_git_repo_template
+        mock_repo.reset_mock()
+        mock_repo.repository_path = tmp_path
+
+        # Mock the git repository
+        monkeypatch.setattr(
+            git_repository,
+            "Repository",
+            unittest.mock.MagicMock(return_value=mock_repo),
+        )
+
+        return tmp_path, mock_repo
 
     @pytest.fixture
     async def repository_manager(self, mock_git_repo, db_session):